@@ -5,10 +5,12 @@ This plugin provides NRL Rugby League scoreboard
 functionality by reusing proven, working manager classes.
 """
 
+import concurrent.futures
 import logging
+import sys
 import time
-import threading
-from typing import Dict, Any, Set, Optional, List, Tuple
+from collections import ChainMap, defaultdict
+from typing import Dict, Any, Mapping, Set, Optional, List, Tuple
 
 from PIL import ImageFont
 
@@ -46,6 +48,42 @@ from ncaaw_basketball_managers import (
 
 logger = logging.getLogger(__name__)
 
+# Order of managers in the per-league manager tuples
+_MODE_TYPE_ORDER = ('live', 'recent', 'upcoming')
+_MODE_TYPES = frozenset(_MODE_TYPE_ORDER)
+
+# Plugin attribute names of every league manager, in league priority order
+_MANAGER_ATTRS = tuple(
+    f"{league_id}_{mode_type}"
+    for league_id in ('nrl', 'wnba', 'ncaam', 'ncaaw')
+    for mode_type in _MODE_TYPE_ORDER
+)
+
+# Manager attributes holding each mode's game list, in lookup order
+_GAMES_ATTRS = {
+    'live': ('live_games',),
+    'recent': ('games_list', 'recent_games'),
+    'upcoming': ('games_list', 'upcoming_games'),
+}
+
+# Game-list attributes probed, in order, on managers without a GAMES_ATTR
+_PROBED_GAMES_ATTRS = ("live_games", "games_list", "recent_games", "upcoming_games")
+
+# Human-readable league names used in log messages
+_LEAGUE_DISPLAY_NAMES = {
+    'nrl': 'NRL',
+    'wnba': 'WNBA',
+    'ncaam': "NCAA Men's",
+    'ncaaw': "NCAA Women's",
+}
+
+# Game state inferred for scroll games that carry none, by mode type
+_SCROLL_STATE_MAP = {'live': 'in', 'recent': 'post', 'upcoming': 'pre'}
+
+# Memo of _build_manager_key() results: {(mode_name, manager_class): "mode:ManagerClass"}.
+# Bounded by display modes x manager classes, so it never needs evicting.
+_MANAGER_KEY_CACHE: Dict[Tuple[str, type], str] = {}
+
 
 class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
     """
@@ -88,8 +126,8 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             self.display_height = getattr(display_manager, "height", 32)
 
         # League configurations
-        self.logger.debug(f"Rugby League plugin received config keys: {list(config.keys())}")
-        self.logger.debug(f"NRL config: {config.get('nrl', {})}")
+        self.logger.debug("Rugby League plugin received config keys: %s", list(config.keys()))
+        self.logger.debug("NRL config: %s", config.get('nrl', {}))
         
         self.nrl_enabled = config.get("nrl", {}).get("enabled", False)
         self.wnba_enabled = config.get("wnba", {}).get("enabled", False)
@@ -97,8 +135,8 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         self.ncaaw_enabled = config.get("ncaaw", {}).get("enabled", False)
         
         self.logger.info(
-            f"League enabled states - NRL: {self.nrl_enabled}, WNBA: {self.wnba_enabled}, "
-            f"NCAA Men's: {self.ncaam_enabled}, NCAA Women's: {self.ncaaw_enabled}"
+            "League enabled states - NRL: %s, WNBA: %s, NCAA Men's: %s, NCAA Women's: %s",
+            self.nrl_enabled, self.wnba_enabled, self.ncaam_enabled, self.ncaaw_enabled
         )
 
         # Global settings
@@ -111,6 +149,21 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         self.ncaam_live_priority = self.config.get("ncaam", {}).get("live_priority", False)
         self.ncaaw_live_priority = self.config.get("ncaaw", {}).get("live_priority", False)
 
+        # Persistent worker pool for parallel manager updates (one worker per
+        # league/mode manager) so update() doesn't spawn fresh threads each call
+        self._update_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=12, thread_name_prefix="Update"
+        )
+        # Separate pool for live refreshes on the display path (one worker per
+        # league's live manager), so they never queue behind season fetches
+        self._live_update_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(_LEAGUE_DISPLAY_NAMES), thread_name_prefix="LiveUpdate"
+        )
+        # In-flight manager updates: {id(manager): future}. A manager whose last
+        # update is still running (e.g. a hung fetch past the wait timeout) is not
+        # resubmitted, so slow fetches can't pile up and exhaust the pool
+        self._update_futures: Dict[int, concurrent.futures.Future] = {}
+
         # Initialize background service if available
         self.background_service = None
         if get_background_service:
@@ -120,7 +173,7 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
                 )
                 self.logger.info("Background service initialized")
             except Exception as e:
-                self.logger.warning(f"Could not initialize background service: {e}")
+                self.logger.warning("Could not initialize background service: %s", e)
         
         # Initialize scroll display manager if available
         self._scroll_manager: Optional[ScrollDisplayManager] = None
@@ -133,14 +186,14 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
                 )
                 self.logger.info("Scroll display manager initialized")
             except Exception as e:
-                self.logger.warning(f"Could not initialize scroll display manager: {e}")
+                self.logger.warning("Could not initialize scroll display manager: %s", e)
                 self._scroll_manager = None
         else:
             self.logger.debug("Scroll mode not available - ScrollDisplayManager not imported")
         
         # Track current scroll state
-        self._scroll_active: Dict[str, bool] = {}  # {game_type: is_active}
-        self._scroll_prepared: Dict[str, bool] = {}  # {game_type: is_prepared}
+        self._scroll_active: Dict[Tuple[str, str], bool] = {}  # {(display_mode, game_type): is_active}
+        self._scroll_prepared: Dict[Tuple[str, str], bool] = {}  # {(display_mode, game_type): is_prepared}
         
         # Enable high-FPS mode for scroll display (allows 100+ FPS scrolling)
         self.enable_scrolling = self._scroll_manager is not None
@@ -159,18 +212,27 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         # Initialize league registry after managers are created
         # This centralizes league management and makes it easy to add more leagues
         self._initialize_league_registry()
+        self._recompute_enabled_flags()
+        self._build_manager_lookups()
+        self._rebuild_config_caches()
 
         # Mode cycling
         self.current_mode_index = 0
         self.last_mode_switch = 0
         self.modes = self._get_available_modes()
+        # Indices of *_live modes, used to stay on / jump to live content when it appears
+        self._live_mode_indices: frozenset = frozenset(
+            i for i, mode in enumerate(self.modes) if mode.endswith('_live')
+        )
+        self._first_live_mode_index: Optional[int] = min(self._live_mode_indices, default=None)
 
         self.logger.info(
-            f"Rugby League scoreboard plugin initialized - {self.display_width}x{self.display_height}"
+            "Rugby League scoreboard plugin initialized - %sx%s",
+            self.display_width, self.display_height
         )
         self.logger.info(
-            f"NRL enabled: {self.nrl_enabled}, WNBA enabled: {self.wnba_enabled}, "
-            f"NCAA Men's enabled: {self.ncaam_enabled}, NCAA Women's enabled: {self.ncaaw_enabled}"
+            "NRL enabled: %s, WNBA enabled: %s, NCAA Men's enabled: %s, NCAA Women's enabled: %s",
+            self.nrl_enabled, self.wnba_enabled, self.ncaam_enabled, self.ncaaw_enabled
         )
 
         # Dynamic duration tracking
@@ -185,7 +247,7 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         # Using game IDs instead of indices prevents start time resets when game order changes
         self._game_id_start_times: Dict[str, Dict[str, float]] = {}  # {manager_key: {game_id: start_time}}
         # Track which managers were actually used for each display mode
-        self._display_mode_to_managers: Dict[str, Set[str]] = {}  # {display_mode: {manager_key, ...}}
+        self._display_mode_to_managers: Dict[str, Set[str]] = defaultdict(set)  # {display_mode: {manager_key, ...}}
         
         # Track last display mode to detect when we return after being away
         self._last_display_mode: Optional[str] = None  # Track previous display mode
@@ -195,10 +257,36 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         # Sticky manager tracking - ensures we complete all games from one league before switching
         self._sticky_manager_per_mode: Dict[str, Any] = {}  # {display_mode: manager_instance}
         self._sticky_manager_start_time: Dict[str, float] = {}  # {display_mode: timestamp}
+        # (display_mode, manager class) pairs already logged at INFO this cycle
+        self._sticky_logged: Set[Tuple[str, str]] = set()
+        
+        # Per-manager cache of _has_live_games_for_manager(): {id(manager): (live_games list, its length, result)}
+        self._live_games_result_cache: Dict[int, Tuple[Any, int, bool]] = {}
+        # Per-manager favorite-team sets: {id(manager): (favorite_teams list, its length, frozenset of it)}
+        self._favorite_team_sets: Dict[int, Tuple[Any, int, frozenset]] = {}
+        # Per-manager game-ID sets: {id(manager): (games list, its length, frozenset of game IDs)}
+        self._manager_game_ids_cache: Dict[int, Tuple[Any, int, frozenset]] = {}
+        
+        # Short-lived memo of get_cycle_duration(): {(display_mode, display_league): (timestamp, duration)}
+        self._cycle_duration_cache: Dict[Tuple[str, Optional[str]], Tuple[float, Optional[float]]] = {}
+        self._cycle_duration_ttl: float = 1.0  # Seconds a cached duration stays valid
+        
+        # Memo of get_vegas_display_mode(): (raw config vegas_mode value, resolved mode)
+        self._vegas_mode_cache: Optional[Tuple[Any, Any]] = None
         
-        # Throttle logging for has_live_content() when returning False
-        self._last_live_content_false_log: float = 0.0  # Timestamp of last False log
-        self._live_content_log_interval: float = 60.0  # Log False results every 60 seconds
+        # Memo of _parse_mode(): {mode_name: (league_id, mode_type)}
+        self._mode_parse_cache: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        
+        # Throttle for _ensure_manager_updated(): {id(manager): timestamp of last staleness check}
+        self._last_update_check: Dict[int, float] = {}
+        self._update_check_interval: float = 0.5  # Minimum seconds between checks per manager
+        
+        # Last has_live_content() result, so only state transitions are logged at INFO
+        self._last_live_state: Optional[bool] = None
+        
+        # Short-lived memo of leagues with live content (see _compute_live_leagues)
+        self._live_leagues_cache: Tuple[float, tuple, Tuple[str, ...]] = (0.0, (), ())  # (timestamp, signature, leagues)
+        self._live_leagues_cache_interval: float = 0.5  # Seconds a cached result stays valid
         
         # Track current game for transition detection
         # Format: {display_mode: {'game_id': str, 'league': str, 'last_log_time': float}}
@@ -210,15 +298,19 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         # Reset when mode changes or full cycle completes
         self._mode_start_time: Dict[str, float] = {}
         
-        # Display mode settings parsing (for future scroll mode support in config schema)
-        self._display_mode_settings = self._parse_display_mode_settings()
-        
         # Track current display context for granular dynamic duration
         self._current_display_league: Optional[str] = None  # 'nrl', 'wnba', 'ncaam', 'ncaaw'
         self._current_display_mode_type: Optional[str] = None  # 'live', 'recent', 'upcoming'
 
     def _initialize_managers(self):
         """Initialize all manager instances."""
+        # Managers of disabled leagues stay None, so callers can test `is not None`
+        # instead of probing with hasattr()
+        self.nrl_live = self.nrl_recent = self.nrl_upcoming = None
+        self.wnba_live = self.wnba_recent = self.wnba_upcoming = None
+        self.ncaam_live = self.ncaam_recent = self.ncaam_upcoming = None
+        self.ncaaw_live = self.ncaaw_recent = self.ncaaw_upcoming = None
+        
         try:
             # Create adapted configs for managers
             nrl_config = self._adapt_config_for_manager("nrl")
@@ -279,7 +371,7 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
                 self.logger.info("NCAA Women's managers initialized")
 
         except Exception as e:
-            self.logger.error(f"Error initializing managers: {e}", exc_info=True)
+            self.logger.error("Error initializing managers: %s", e, exc_info=True)
 
     def _initialize_league_registry(self) -> None:
         """
@@ -314,9 +406,9 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             'priority': 1,  # Highest priority - shows first
             'live_priority': self.nrl_live_priority,
             'managers': {
-                'live': getattr(self, 'nrl_live', None),
-                'recent': getattr(self, 'nrl_recent', None),
-                'upcoming': getattr(self, 'nrl_upcoming', None),
+                'live': self.nrl_live,
+                'recent': self.nrl_recent,
+                'upcoming': self.nrl_upcoming,
             }
         }
         
@@ -326,9 +418,9 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             'priority': 2,  # Second priority - shows after NRL
             'live_priority': self.wnba_live_priority,
             'managers': {
-                'live': getattr(self, 'wnba_live', None),
-                'recent': getattr(self, 'wnba_recent', None),
-                'upcoming': getattr(self, 'wnba_upcoming', None),
+                'live': self.wnba_live,
+                'recent': self.wnba_recent,
+                'upcoming': self.wnba_upcoming,
             }
         }
         
@@ -338,9 +430,9 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             'priority': 3,  # Third priority - shows after WNBA
             'live_priority': self.ncaam_live_priority,
             'managers': {
-                'live': getattr(self, 'ncaam_live', None),
-                'recent': getattr(self, 'ncaam_recent', None),
-                'upcoming': getattr(self, 'ncaam_upcoming', None),
+                'live': self.ncaam_live,
+                'recent': self.ncaam_recent,
+                'upcoming': self.ncaam_upcoming,
             }
         }
         
@@ -350,9 +442,9 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             'priority': 4,  # Fourth priority - shows after NCAA Men's
             'live_priority': self.ncaaw_live_priority,
             'managers': {
-                'live': getattr(self, 'ncaaw_live', None),
-                'recent': getattr(self, 'ncaaw_recent', None),
-                'upcoming': getattr(self, 'ncaaw_upcoming', None),
+                'live': self.ncaaw_live,
+                'recent': self.ncaaw_recent,
+                'upcoming': self.ncaaw_upcoming,
             }
         }
         
@@ -360,18 +452,178 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         enabled_leagues = [lid for lid, data in self._league_registry.items() if data.get('enabled', False)]
         disabled_leagues = [lid for lid, data in self._league_registry.items() if not data.get('enabled', False)]
         self.logger.info(
-            f"League registry initialized: {len(self._league_registry)} league(s) registered, "
-            f"{len(enabled_leagues)} enabled: {enabled_leagues}, "
-            f"{len(disabled_leagues)} disabled: {disabled_leagues}"
+            "League registry initialized: %s league(s) registered, %s enabled: %s, %s disabled: %s",
+            len(self._league_registry), len(enabled_leagues), enabled_leagues, len(disabled_leagues),
+            disabled_leagues
         )
         # Log detailed enabled state for each league (INFO level for visibility)
         for league_id, league_data in self._league_registry.items():
             self.logger.info(
-                f"League {league_id}: enabled={league_data.get('enabled', False)} (type: {type(league_data.get('enabled', False))}), "
-                f"priority={league_data.get('priority', 999)}"
+                "League %s: enabled=%s (type: %s), priority=%s",
+                league_id, league_data.get('enabled', False),
+                type(league_data.get('enabled', False)), league_data.get('priority', 999)
             )
 
-    def _get_enabled_leagues_for_mode(self, mode_type: str) -> List[str]:
+    def _recompute_enabled_flags(self) -> None:
+        """
+        Cache league enabled/live_priority state derived from the league registry.
+        
+        - _enabled_leagues: enabled league IDs in priority order
+        - _live_priority_leagues: enabled leagues with live_priority, in priority order
+        - _any_live_priority: True if any enabled league has live_priority
+        
+        Also drops the per-mode results memoized by _get_enabled_leagues_for_mode().
+        Must be called again whenever the registry's enabled/live_priority flags change.
+        """
+        self._enabled_leagues_by_mode: Dict[str, Tuple[str, ...]] = {}
+        sorted_leagues = sorted(
+            self._league_registry.items(),
+            key=lambda item: item[1].get('priority', 999)
+        )
+        self._enabled_leagues: Tuple[str, ...] = tuple(
+            league_id for league_id, league_data in sorted_leagues
+            if league_data.get('enabled', False)
+        )
+        self._live_priority_leagues: Tuple[str, ...] = tuple(
+            league_id for league_id in self._enabled_leagues
+            if self._league_registry[league_id].get('live_priority', False)
+        )
+        self._any_live_priority = bool(self._live_priority_leagues)
+
+    def _build_manager_lookups(self) -> None:
+        """
+        Precompute manager lookup tables from the league registry.
+        
+        - _league_managers: {league_id: (live, recent, upcoming)} for enabled
+          leagues, in priority order
+        - _manager_to_league: {id(manager): (league_id, mode_type)} so the
+          owning league of a manager is a single dict lookup
+        - _live_priority_managers: live managers of enabled live_priority
+          leagues, in priority order
+        - _combined_managers: {mode_type: (manager, ...)} across enabled
+          leagues, in priority order, for the legacy combined display modes
+        - _mode_to_manager: {'<league_id>_<mode_type>': manager} for enabled
+          leagues' initialized managers
+        """
+        self._league_managers: Dict[str, Tuple[Any, Any, Any]] = {}
+        self._manager_to_league: Dict[int, Tuple[str, str]] = {}
+        self._mode_to_manager: Dict[str, Any] = {}
+        
+        for league_id in self._enabled_leagues:
+            managers = self._league_registry[league_id].get('managers', {})
+            self._league_managers[league_id] = tuple(
+                managers.get(mode_type) for mode_type in _MODE_TYPE_ORDER
+            )
+            for mode_type, manager in managers.items():
+                if manager is not None:
+                    self._manager_to_league[id(manager)] = (league_id, mode_type)
+                    self._mode_to_manager[f"{league_id}_{mode_type}"] = manager
+        
+        self._live_priority_managers: Tuple[Any, ...] = tuple(
+            self._league_managers[league_id][0]
+            for league_id in self._live_priority_leagues
+            if self._league_managers[league_id][0] is not None
+        )
+        self._combined_managers: Dict[str, Tuple[Any, ...]] = {
+            mode_type: tuple(
+                managers[mode_index]
+                for managers in self._league_managers.values()
+                if managers[mode_index] is not None
+            )
+            for mode_index, mode_type in enumerate(_MODE_TYPE_ORDER)
+        }
+
+    def _rebuild_config_caches(self) -> None:
+        """
+        Precompute lookups derived from self.config.
+        
+        Called at init and from on_config_change() so the hot display path can
+        use flat dict lookups instead of walking nested config dicts.
+        
+        - _mode_duration_flat: {(league_id, mode_type): seconds} for every
+          configured, numeric <mode_type>_mode_duration
+        - _display_mode_settings: parsed per-league switch/scroll display modes
+        - _scroll_mode_keys: {(league_id, mode_type)} pairs configured for scroll mode
+        - _game_duration_flat: {(league_id, mode_type): seconds} per-game durations from
+          display_durations.<mode_type> (or live_game_duration for live mode)
+        - _dynamic_enabled_flat: {(league_id, mode_type): bool} for every pair with an
+          explicit per-mode or per-league dynamic_duration.enabled setting
+        - _dynamic_cap_flat: {(league_id, mode_type): seconds} for every pair with a
+          valid, positive per-mode or per-league max_duration_seconds
+        - _any_dynamic_enabled: True if dynamic duration is on for any league/mode
+        """
+        self._mode_duration_flat: Dict[Tuple[str, str], float] = {}
+        self._game_duration_flat: Dict[Tuple[str, str], float] = {}
+        self._dynamic_enabled_flat: Dict[Tuple[str, str], bool] = {}
+        self._dynamic_cap_flat: Dict[Tuple[str, str], float] = {}
+        for league_id in self._league_registry:
+            league_config = self.config.get(league_id, {})
+            league_dynamic = league_config.get("dynamic_duration", {})
+            league_modes = league_dynamic.get("modes", {})
+            for mode_type in _MODE_TYPE_ORDER:
+                key = (league_id, mode_type)
+                # Per-league/per-mode setting first (most specific), then per-league
+                mode_config = league_modes.get(mode_type, {})
+                if "enabled" in mode_config:
+                    self._dynamic_enabled_flat[key] = bool(mode_config.get("enabled", False))
+                elif "enabled" in league_dynamic:
+                    self._dynamic_enabled_flat[key] = bool(league_dynamic.get("enabled", False))
+                
+                for source in (mode_config, league_dynamic):
+                    if "max_duration_seconds" not in source:
+                        continue
+                    try:
+                        cap = float(source.get("max_duration_seconds"))
+                    except (TypeError, ValueError):
+                        continue
+                    if cap > 0:
+                        self._dynamic_cap_flat[key] = cap
+                        break
+            
+            display_durations = league_config.get("display_durations", {})
+            for mode_type in _MODE_TYPE_ORDER:
+                # e.g., 'live' maps to display_durations.live
+                value = display_durations.get(mode_type)
+                if value is None and mode_type == 'live':
+                    value = league_config.get("live_game_duration")
+                if value is None:
+                    continue
+                try:
+                    self._game_duration_flat[(league_id, mode_type)] = float(value)
+                except (TypeError, ValueError):
+                    pass
+            
+            mode_durations = league_config.get("mode_durations", {})
+            for mode_type in _MODE_TYPE_ORDER:
+                value = mode_durations.get(f"{mode_type}_mode_duration")
+                if value is None:
+                    continue
+                try:
+                    self._mode_duration_flat[(league_id, mode_type)] = float(value)
+                except (TypeError, ValueError):
+                    pass
+        
+        self._any_dynamic_enabled: bool = any(self._dynamic_enabled_flat.values())
+        
+        self._display_mode_settings = self._parse_display_mode_settings()
+        self._scroll_mode_keys: frozenset = frozenset(
+            (league_id, mode_type)
+            for league_id, league_settings in self._display_mode_settings.items()
+            for mode_type, display_mode in league_settings.items()
+            if display_mode == 'scroll'
+        )
+
+    def on_config_change(self, new_config: Dict[str, Any]) -> None:
+        """Refresh config-derived lookup tables after the plugin config is updated."""
+        if BasePlugin:
+            super().on_config_change(new_config)
+        else:
+            self.config = new_config
+        self._rebuild_config_caches()
+        self._enabled_leagues_by_mode.clear()
+        self._cycle_duration_cache.clear()
+
+    def _get_enabled_leagues_for_mode(self, mode_type: str) -> Tuple[str, ...]:
         """
         Get list of enabled leagues for a specific mode type in priority order.
         
@@ -383,12 +635,17 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             mode_type: Mode type ('live', 'recent', or 'upcoming')
             
         Returns:
-            List of league IDs in priority order (lower priority number = higher priority)
-            Example: ['nrl', 'wnba'] means NRL shows first, then WNBA
+            Tuple of league IDs in priority order (lower priority number = higher priority)
+            Example: ('nrl', 'wnba') means NRL shows first, then WNBA
             
         This is the core method for sequential block display - it determines
-        which leagues should be shown and in what order.
+        which leagues should be shown and in what order. Results are memoized per
+        mode type until the registry flags or the config change.
         """
+        cached = self._enabled_leagues_by_mode.get(mode_type)
+        if cached is not None:
+            return cached
+        
         enabled_leagues = []
         
         # Iterate through all registered leagues
@@ -419,10 +676,12 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         enabled_leagues.sort(key=lambda lid: self._league_registry[lid].get('priority', 999))
         
         self.logger.debug(
-            f"Enabled leagues for {mode_type} mode: {enabled_leagues} "
-            f"(priorities: {[self._league_registry[lid].get('priority') for lid in enabled_leagues]})"
+            "Enabled leagues for %s mode: %s (priorities: %s)",
+            mode_type, enabled_leagues,
+            [self._league_registry[lid].get('priority') for lid in enabled_leagues]
         )
         
+        enabled_leagues = self._enabled_leagues_by_mode[mode_type] = tuple(enabled_leagues)
         return enabled_leagues
 
     def _apply_sticky_manager_logic(self, display_mode: str, managers_to_try: list) -> list:
@@ -438,29 +697,30 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         sticky_manager = self._sticky_manager_per_mode.get(display_mode)
         
         self.logger.info(
-            f"Sticky manager check for {display_mode}: "
-            f"sticky={sticky_manager.__class__.__name__ if sticky_manager else None}, "
-            f"available_managers={[m.__class__.__name__ for m in managers_to_try if m]}"
+            "Sticky manager check for %s: sticky=%s, available_managers=%s",
+            display_mode, sticky_manager.__class__.__name__ if sticky_manager else None,
+            [m.__class__.__name__ for m in managers_to_try if m]
         )
         
         if sticky_manager and sticky_manager in managers_to_try:
             self.logger.info(
-                f"Using sticky manager {sticky_manager.__class__.__name__} for {display_mode} - "
-                "RESTRICTING to this manager only"
+                "Using sticky manager %s for %s - RESTRICTING to this manager only",
+                sticky_manager.__class__.__name__, display_mode
             )
             return [sticky_manager]
         
         # No sticky manager or not in list - clean up if needed
         if sticky_manager:
             self.logger.info(
-                f"Sticky manager {sticky_manager.__class__.__name__} no longer available for {display_mode}, "
-                f"selecting new one from {len(managers_to_try)} options"
+                "Sticky manager %s no longer available for %s, selecting new one from %s options",
+                sticky_manager.__class__.__name__, display_mode, len(managers_to_try)
             )
             self._sticky_manager_per_mode.pop(display_mode, None)
             self._sticky_manager_start_time.pop(display_mode, None)
         else:
             self.logger.info(
-                f"No sticky manager yet for {display_mode}, will select from {len(managers_to_try)} available managers"
+                "No sticky manager yet for %s, will select from %s available managers",
+                display_mode, len(managers_to_try)
             )
         
         return managers_to_try
@@ -493,14 +753,15 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             if manager:
                 managers.append(manager)
                 self.logger.debug(
-                    f"Added {league_id} {mode_type} manager to priority list "
-                    f"(priority: {self._league_registry[league_id].get('priority', 999)})"
+                    "Added %s %s manager to priority list (priority: %s)",
+                    league_id, mode_type, self._league_registry[league_id].get('priority', 999)
                 )
         
-        self.logger.debug(
-            f"Managers in priority order for {mode_type}: "
-            f"{[m.__class__.__name__ for m in managers]}"
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Managers in priority order for %s: %s",
+                mode_type, [m.__class__.__name__ for m in managers]
+            )
         
         return managers
 
@@ -524,7 +785,7 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         """
         # Check if league exists in registry
         if league_id not in self._league_registry:
-            self.logger.warning(f"League {league_id} not found in registry")
+            self.logger.warning("League %s not found in registry", league_id)
             return None
         
         # Get managers dict for this league
@@ -534,7 +795,7 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         manager = managers.get(mode_type)
         
         if manager is None:
-            self.logger.debug(f"No manager found for {league_id} {mode_type}")
+            self.logger.debug("No manager found for %s %s", league_id, mode_type)
         
         return manager
 
@@ -572,9 +833,9 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         is_complete = manager_key in self._dynamic_managers_completed
         
         if is_complete:
-            self.logger.debug(f"League {league_id} {mode_type} is complete (manager_key: {manager_key})")
+            self.logger.debug("League %s %s is complete (manager_key: %s)", league_id, mode_type, manager_key)
         else:
-            self.logger.debug(f"League {league_id} {mode_type} is not complete (manager_key: {manager_key})")
+            self.logger.debug("League %s %s is not complete (manager_key: %s)", league_id, mode_type, manager_key)
         
         return is_complete
 
@@ -599,42 +860,37 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
                 'upcoming': display_modes_config.get('upcoming_display_mode', 'switch'),
             }
             
-            self.logger.debug(f"Display mode settings for {league}: {settings[league]}")
+            self.logger.debug("Display mode settings for %s: %s", league, settings[league])
         
         return settings
     
-    def _get_display_mode(self, league: str, game_type: str) -> str:
-        """
-        Get the display mode for a specific league and game type.
+    def _extract_mode_type(self, display_mode: str) -> Optional[str]:
+        """Extract mode type (live, recent, upcoming) from display mode string.
         
         Args:
-            league: 'nrl', 'wnba', 'ncaam', or 'ncaaw'
-            game_type: 'live', 'recent', or 'upcoming'
+            display_mode: Display mode string (e.g., 'basketball_live', 'nrl_recent')
             
         Returns:
-            'switch' or 'scroll'
+            Mode type string ('live', 'recent', 'upcoming') or None
         """
-        if not hasattr(self, '_display_mode_settings') or league not in self._display_mode_settings:
-            return 'switch'
-        
-        return self._display_mode_settings[league].get(game_type, 'switch')
+        _, sep, mode_type = display_mode.rpartition('_')
+        return mode_type if sep and mode_type in _MODE_TYPES else None
 
-    def _extract_mode_type(self, display_mode: str) -> Optional[str]:
-        """Extract mode type (live, recent, upcoming) from display mode string.
+    def _parse_mode(self, mode_name: str) -> Tuple[Optional[str], Optional[str]]:
+        """Split a granular mode name into (league, mode_type).
         
         Args:
-            display_mode: Display mode string (e.g., 'basketball_live', 'nrl_recent')
+            mode_name: Mode name string (e.g., 'nrl_recent', 'wnba_live')
             
         Returns:
-            Mode type string ('live', 'recent', 'upcoming') or None
+            (league, mode_type) for a registered league prefix, else (None, None)
         """
-        if display_mode.endswith('_live'):
-            return 'live'
-        elif display_mode.endswith('_recent'):
-            return 'recent'
-        elif display_mode.endswith('_upcoming'):
-            return 'upcoming'
-        return None
+        parsed = self._mode_parse_cache.get(mode_name)
+        if parsed is None:
+            prefix, _, mode_type = mode_name.partition('_')
+            parsed = (prefix, mode_type) if prefix in self._league_registry else (None, None)
+            self._mode_parse_cache[mode_name] = parsed
+        return parsed
 
     def _get_game_duration(self, league: str, mode_type: str, manager=None) -> float:
         """Get game duration for a league and mode type combination.
@@ -658,22 +914,10 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             if manager_duration is not None:
                 return float(manager_duration)
         
-        # Next, try league-specific mode duration from display_durations
-        league_config = self.config.get(league, {})
-        display_durations = league_config.get("display_durations", {})
-        mode_duration_key = mode_type  # e.g., 'live' maps to display_durations.live
-        mode_duration = display_durations.get(mode_duration_key)
-        if mode_duration is not None:
-            return float(mode_duration)
-        
-        # Try live_game_duration for live mode
-        if mode_type == 'live':
-            live_duration = league_config.get("live_game_duration")
-            if live_duration is not None:
-                return float(live_duration)
-        
-        # Fallback to league-specific default (15 seconds)
-        return 15.0
+        # Next, league-specific mode duration from display_durations (or
+        # live_game_duration for live mode), flattened at config load;
+        # fallback to league-specific default (15 seconds)
+        return self._game_duration_flat.get((league, mode_type), 15.0)
 
     def _get_mode_duration(self, league: str, mode_type: str) -> Optional[float]:
         """
@@ -689,21 +933,9 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         Returns:
             Mode duration in seconds (float) or None if not configured
         """
-        league_config = self.config.get(league, {})
-        mode_durations = league_config.get("mode_durations", {})
-        
-        # Check per-mode setting (e.g., live_mode_duration, recent_mode_duration)
-        mode_duration_key = f"{mode_type}_mode_duration"
-        if mode_duration_key in mode_durations:
-            value = mode_durations[mode_duration_key]
-            if value is not None:
-                try:
-                    return float(value)
-                except (TypeError, ValueError):
-                    pass
-        
-        # No per-mode setting configured - return None to use dynamic calculation
-        return None
+        # Per-mode settings (e.g., live_mode_duration) are flattened at config load;
+        # a miss means no setting configured - return None to use dynamic calculation
+        return self._mode_duration_flat.get((league, mode_type))
 
     def _adapt_config_for_manager(self, league: str) -> Dict[str, Any]:
         """
@@ -714,7 +946,7 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         """
         league_config = self.config.get(league, {})
         
-        self.logger.debug(f"DEBUG: league_config for {league} = {league_config}")
+        self.logger.debug("DEBUG: league_config for %s = %s", league, league_config)
 
         # Extract nested configurations
         game_limits = league_config.get("game_limits", {})
@@ -739,10 +971,14 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             show_favorites_only = False
         
         self.logger.debug(
-            f"Config reading for {league}: "
-            f"league_config.show_favorite_teams_only={league_config.get('show_favorite_teams_only', 'NOT_SET')}, "
-            f"filtering.show_favorite_teams_only={filtering.get('show_favorite_teams_only', 'NOT_SET')}, "
-            f"final show_favorites_only={show_favorites_only}"
+            "Config reading for %s: "
+            "league_config.show_favorite_teams_only=%s, "
+            "filtering.show_favorite_teams_only=%s, "
+            "final show_favorites_only=%s",
+            league,
+            league_config.get('show_favorite_teams_only', 'NOT_SET'),
+            filtering.get('show_favorite_teams_only', 'NOT_SET'),
+            show_favorites_only,
         )
 
         # Explicitly check if key exists for show_all_live
@@ -754,10 +990,14 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             show_all_live = False
         
         self.logger.debug(
-            f"Config reading for {league}: "
-            f"league_config.show_all_live={league_config.get('show_all_live', 'NOT_SET')}, "
-            f"filtering.show_all_live={filtering.get('show_all_live', 'NOT_SET')}, "
-            f"final show_all_live={show_all_live}"
+            "Config reading for %s: "
+            "league_config.show_all_live=%s, "
+            "filtering.show_all_live=%s, "
+            "final show_all_live=%s",
+            league,
+            league_config.get('show_all_live', 'NOT_SET'),
+            filtering.get('show_all_live', 'NOT_SET'),
+            show_all_live,
         )
 
         # Create manager config with expected structure
@@ -812,7 +1052,7 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             }
         )
 
-        self.logger.debug(f"Using timezone: {timezone_str} for {league} managers")
+        self.logger.debug("Using timezone: %s for %s managers", timezone_str, league)
 
         return manager_config
 
@@ -831,14 +1071,14 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             # Check if league is enabled - must be explicitly True
             league_enabled = league_data.get('enabled', False)
             self.logger.info(
-                f"_get_available_modes: Checking {league_id}: enabled={league_enabled} "
-                f"(type: {type(league_enabled)}, bool check: {bool(league_enabled)})"
+                "_get_available_modes: Checking %s: enabled=%s (type: %s, bool check: %s)",
+                league_id, league_enabled, type(league_enabled), bool(league_enabled)
             )
             if not league_enabled:
-                self.logger.info(f"Skipping disabled league: {league_id} (enabled={league_enabled})")
+                self.logger.info("Skipping disabled league: %s (enabled=%s)", league_id, league_enabled)
                 continue
             
-            self.logger.info(f"Processing enabled league: {league_id}")
+            self.logger.info("Processing enabled league: %s", league_id)
             
             # Get league config to check display_modes settings
             league_config = self.config.get(league_id, {})
@@ -856,16 +1096,17 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
                 
                 if mode_enabled:
                     modes.append(f"{league_id}_{mode_type}")
-                    self.logger.debug(f"Added mode: {league_id}_{mode_type}")
+                    self.logger.debug("Added mode: %s_%s", league_id, mode_type)
 
         # Default to NRL if no leagues enabled
         if not modes:
             modes = ["nrl_recent", "nrl_upcoming", "nrl_live"]
 
         self.logger.info(
-            f"Available modes generated: {len(modes)} mode(s) - {modes}. "
-            f"Enabled leagues: NRL={self.nrl_enabled}, WNBA={self.wnba_enabled}, "
-            f"NCAA Men's={self.ncaam_enabled}, NCAA Women's={self.ncaaw_enabled}"
+            "Available modes generated: %d mode(s) - %s. "
+            "Enabled leagues: NRL=%s, WNBA=%s, NCAA Men's=%s, NCAA Women's=%s",
+            len(modes), modes,
+            self.nrl_enabled, self.wnba_enabled, self.ncaam_enabled, self.ncaaw_enabled
         )
         return modes
 
@@ -874,89 +1115,29 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         if not self.modes:
             return None
 
-        current_mode = self.modes[self.current_mode_index]
-
-        if current_mode.startswith("nrl_"):
-            if not self.nrl_enabled:
-                return None
-            mode_type = current_mode.split("_", 1)[1]  # "live", "recent", "upcoming"
-            if mode_type == "live":
-                return self.nrl_live
-            elif mode_type == "recent":
-                return self.nrl_recent
-            elif mode_type == "upcoming":
-                return self.nrl_upcoming
-
-        elif current_mode.startswith("wnba_"):
-            if not self.wnba_enabled:
-                return None
-            mode_type = current_mode.split("_", 1)[1]
-            if mode_type == "live":
-                return self.wnba_live
-            elif mode_type == "recent":
-                return self.wnba_recent
-            elif mode_type == "upcoming":
-                return self.wnba_upcoming
-
-        elif current_mode.startswith("ncaam_"):
-            if not self.ncaam_enabled:
-                return None
-            mode_type = current_mode.split("_", 1)[1]
-            if mode_type == "live":
-                return self.ncaam_live
-            elif mode_type == "recent":
-                return self.ncaam_recent
-            elif mode_type == "upcoming":
-                return self.ncaam_upcoming
-
-        elif current_mode.startswith("ncaaw_"):
-            if not self.ncaaw_enabled:
-                return None
-            mode_type = current_mode.split("_", 1)[1]
-            if mode_type == "live":
-                return self.ncaaw_live
-            elif mode_type == "recent":
-                return self.ncaaw_recent
-            elif mode_type == "upcoming":
-                return self.ncaaw_upcoming
-
-        return None
+        # Enabled leagues' granular modes map straight to their managers;
+        # disabled leagues and unknown modes resolve to None
+        return self._mode_to_manager.get(self.modes[self.current_mode_index])
 
     def update(self) -> None:
         """Update basketball game data using parallel manager updates."""
         if not self.is_enabled:
             return
 
-        # Collect all manager update tasks
+        # Collect manager update tasks for enabled leagues, in priority order.
+        # Recent/upcoming managers return early until their update_interval has
+        # elapsed, so don't dispatch them before they are due. Live managers always
+        # run: their update() also rotates the displayed game between fetches.
+        current_time = time.time()
         update_tasks = []
-        
-        if self.nrl_enabled:
-            update_tasks.extend([
-                ("NRL Live", self.nrl_live.update),
-                ("NRL Recent", self.nrl_recent.update),
-                ("NRL Upcoming", self.nrl_upcoming.update),
-            ])
-        
-        if self.wnba_enabled:
-            update_tasks.extend([
-                ("WNBA Live", self.wnba_live.update),
-                ("WNBA Recent", self.wnba_recent.update),
-                ("WNBA Upcoming", self.wnba_upcoming.update),
-            ])
-        
-        if self.ncaam_enabled:
-            update_tasks.extend([
-                ("NCAA Men's Live", self.ncaam_live.update),
-                ("NCAA Men's Recent", self.ncaam_recent.update),
-                ("NCAA Men's Upcoming", self.ncaam_upcoming.update),
-            ])
-        
-        if self.ncaaw_enabled:
-            update_tasks.extend([
-                ("NCAA Women's Live", self.ncaaw_live.update),
-                ("NCAA Women's Recent", self.ncaaw_recent.update),
-                ("NCAA Women's Upcoming", self.ncaaw_upcoming.update),
-            ])
+        for league_id, managers in self._league_managers.items():
+            league_name = _LEAGUE_DISPLAY_NAMES[league_id]
+            for mode_type, manager in zip(_MODE_TYPE_ORDER, managers):
+                if manager is None:
+                    continue
+                if mode_type != 'live' and current_time - manager.last_update < manager.update_interval:
+                    continue
+                update_tasks.append((f"{league_name} {mode_type.capitalize()}", manager))
         
         if not update_tasks:
             return
@@ -967,28 +1148,52 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             try:
                 update_func()
             except Exception as e:
-                self.logger.error(f"Error updating {name} manager: {e}", exc_info=True)
-        
-        # Start all update threads
-        threads = []
-        for name, update_func in update_tasks:
-            thread = threading.Thread(
-                target=run_update_with_error_handling,
-                args=(name, update_func),
-                daemon=True,
-                name=f"Update-{name}"
+                self.logger.error("Error updating %s manager: %s", name, e, exc_info=True)
+        
+        # Submit updates to the persistent worker pool, skipping managers whose
+        # previous update has not finished yet
+        futures = {}
+        for name, manager in update_tasks:
+            future = self._submit_manager_update(
+                self._update_pool, manager, run_update_with_error_handling, name, manager.update
             )
-            thread.start()
-            threads.append(thread)
-        
-        # Wait for all threads to complete with a reasonable timeout
-        # Use 25 seconds to stay under the 30-second plugin timeout
-        for thread in threads:
-            thread.join(timeout=25.0)
-            if thread.is_alive():
+            if future is None:
                 self.logger.warning(
-                    f"Manager update thread {thread.name} did not complete within timeout"
+                    "Manager update %s still running from a previous cycle, skipping", name
                 )
+                continue
+            futures[future] = name
+        
+        if not futures:
+            return
+        
+        # Wait for all updates to complete with a reasonable timeout
+        # Use 25 seconds to stay under the 30-second plugin timeout
+        _, not_done = concurrent.futures.wait(futures, timeout=25.0)
+        for future in not_done:
+            self.logger.warning(
+                "Manager update %s did not complete within timeout", futures[future]
+            )
+        
+        # Live game lists may have changed - drop the memoized live leagues
+        self._live_leagues_cache = (0.0, (), ())
+
+    def _manager_update_pending(self, manager) -> bool:
+        """Return True if a previously submitted update for manager is still running."""
+        pending = self._update_futures.get(id(manager))
+        return pending is not None and not pending.done()
+
+    def _submit_manager_update(self, pool, manager, fn, *args) -> Optional[concurrent.futures.Future]:
+        """Submit fn(*args) for manager to pool unless its last update is still running.
+        
+        Returns:
+            The new future, or None if the manager's previous update is in flight
+        """
+        if self._manager_update_pending(manager):
+            return None
+        future = pool.submit(fn, *args)
+        self._update_futures[id(manager)] = future
+        return future
 
     def display(self, display_mode: str = None, force_clear: bool = False) -> bool:
         """Display basketball games with mode cycling.
@@ -1006,132 +1211,54 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             if display_mode:
                 # Early exit: Skip if this mode is not in our available modes (disabled league)
                 if display_mode not in self.modes:
-                    self.logger.debug(f"Skipping disabled mode: {display_mode} (not in available modes: {self.modes})")
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug(
+                            "Skipping disabled mode: %s (not in available modes: %s)",
+                            display_mode, self.modes
+                        )
                     return False
                 
-                self.logger.debug(f"Display called with mode: {display_mode}")
-                
-                # Check if this is a granular mode (league-specific, e.g., ncaam_recent, nrl_live)
-                # Granular modes: {league}_{mode_type} format
-                # Known league prefixes: nrl, wnba, ncaam, ncaaw
-                league = None
-                mode_type = None
-                
-                # Try to match against league registry first (most reliable)
-                mode_suffixes = ['_live', '_recent', '_upcoming']
-                for league_id in self._league_registry.keys():
-                    for mode_suffix in mode_suffixes:
-                        expected_mode = f"{league_id}{mode_suffix}"
-                        if display_mode == expected_mode:
-                            league = league_id
-                            mode_type = mode_suffix[1:]  # Remove leading underscore
-                            break
-                    if league:
-                        break
+                self.logger.debug("Display called with mode: %s", display_mode)
                 
-                # Fallback: parse from the end if no registry match
-                if not league:
-                    if display_mode.endswith('_live'):
-                        mode_type = 'live'
-                        potential_league = display_mode[:-5]  # Remove '_live'
-                    elif display_mode.endswith('_recent'):
-                        mode_type = 'recent'
-                        potential_league = display_mode[:-7]  # Remove '_recent'
-                    elif display_mode.endswith('_upcoming'):
-                        mode_type = 'upcoming'
-                        potential_league = display_mode[:-9]  # Remove '_upcoming'
-                    
-                    # Validate it's a known league
-                    if mode_type and potential_league in self._league_registry:
-                        league = potential_league
+                # Parse once as {prefix}_{mode_type}; mode_type must be live/recent/upcoming
+                league, sep, mode_type = display_mode.rpartition('_')
+                if not sep or mode_type not in _MODE_TYPES:
+                    self.logger.warning("Unknown display_mode: %s", display_mode)
+                    return False
                 
-                # If we have a specific league, route directly to it
-                if league and mode_type:
-                    self.logger.debug(f"Granular mode detected: league={league}, mode_type={mode_type}")
+                # Granular mode (league-specific, e.g., ncaam_recent, nrl_live):
+                # known league prefixes route directly to that league
+                if league in self._league_registry:
+                    self.logger.debug("Granular mode detected: league=%s, mode_type=%s", league, mode_type)
                     return self._display_league_mode(league, mode_type, force_clear)
                 
                 # Legacy combined mode handling (basketball_live, basketball_recent, basketball_upcoming)
-                # Extract the mode type for legacy modes
-                if not mode_type:
-                    if display_mode.endswith('_live'):
-                        mode_type = 'live'
-                    elif display_mode.endswith('_recent'):
-                        mode_type = 'recent'
-                    elif display_mode.endswith('_upcoming'):
-                        mode_type = 'upcoming'
-                
-                if not mode_type:
-                    self.logger.warning(f"Unknown display_mode: {display_mode}")
-                    return False
                 
-                self.logger.debug(
-                    f"Legacy combined mode: mode_type={mode_type}, NRL enabled: {self.nrl_enabled}, "
-                    f"WNBA enabled: {self.wnba_enabled}, NCAA Men's enabled: {self.ncaam_enabled}, "
-                    f"NCAA Women's enabled: {self.ncaaw_enabled}"
-                )
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(
+                        "Legacy combined mode: mode_type=%s, NRL enabled: %s, WNBA enabled: %s, "
+                        "NCAA Men's enabled: %s, NCAA Women's enabled: %s",
+                        mode_type, self.nrl_enabled, self.wnba_enabled,
+                        self.ncaam_enabled, self.ncaaw_enabled
+                    )
                 
                 # Determine which manager to use based on enabled leagues
-                # For live mode, prioritize leagues with live content and live_priority enabled
-                managers_to_try = []
-                
+                # (_league_managers only holds enabled leagues, in priority order)
                 if mode_type == 'live':
-                    # Check NRL first (highest priority)
-                    if (self.nrl_enabled and self.nrl_live_priority and 
-                        hasattr(self, 'nrl_live') and 
-                        bool(getattr(self.nrl_live, 'live_games', []))):
-                        managers_to_try.append(self.nrl_live)
-                    # Check WNBA
-                    if (self.wnba_enabled and self.wnba_live_priority and 
-                        hasattr(self, 'wnba_live') and 
-                        bool(getattr(self.wnba_live, 'live_games', []))):
-                        managers_to_try.append(self.wnba_live)
-                    # Check NCAA Men's
-                    if (self.ncaam_enabled and self.ncaam_live_priority and 
-                        hasattr(self, 'ncaam_live') and 
-                        bool(getattr(self.ncaam_live, 'live_games', []))):
-                        managers_to_try.append(self.ncaam_live)
-                    # Check NCAA Women's
-                    if (self.ncaaw_enabled and self.ncaaw_live_priority and 
-                        hasattr(self, 'ncaaw_live') and 
-                        bool(getattr(self.ncaaw_live, 'live_games', []))):
-                        managers_to_try.append(self.ncaaw_live)
+                    # For live mode, prioritize leagues with live content and live_priority enabled
+                    # (live managers always initialize live_games, so read it directly)
+                    managers_to_try = [
+                        live_manager for live_manager in self._live_priority_managers
+                        if live_manager.live_games
+                    ]
                     
-                    # Fallback: if no live content, show any enabled live manager
+                    # Fallback: if no live content, show the first enabled live manager
                     if not managers_to_try:
-                        if self.nrl_enabled and hasattr(self, 'nrl_live'):
-                            managers_to_try.append(self.nrl_live)
-                        elif self.wnba_enabled and hasattr(self, 'wnba_live'):
-                            managers_to_try.append(self.wnba_live)
-                        elif self.ncaam_enabled and hasattr(self, 'ncaam_live'):
-                            managers_to_try.append(self.ncaam_live)
-                        elif self.ncaaw_enabled and hasattr(self, 'ncaaw_live'):
-                            managers_to_try.append(self.ncaaw_live)
+                        managers_to_try = list(self._combined_managers['live'][:1])
                 else:
                     # For recent and upcoming modes, use standard priority order
                     # NRL > WNBA > NCAA Men's > NCAA Women's
-                    if self.nrl_enabled:
-                        if mode_type == 'recent' and hasattr(self, 'nrl_recent'):
-                            managers_to_try.append(self.nrl_recent)
-                        elif mode_type == 'upcoming' and hasattr(self, 'nrl_upcoming'):
-                            managers_to_try.append(self.nrl_upcoming)
-                    
-                    if self.wnba_enabled:
-                        if mode_type == 'recent' and hasattr(self, 'wnba_recent'):
-                            managers_to_try.append(self.wnba_recent)
-                        elif mode_type == 'upcoming' and hasattr(self, 'wnba_upcoming'):
-                            managers_to_try.append(self.wnba_upcoming)
-                    
-                    if self.ncaam_enabled:
-                        if mode_type == 'recent' and hasattr(self, 'ncaam_recent'):
-                            managers_to_try.append(self.ncaam_recent)
-                        elif mode_type == 'upcoming' and hasattr(self, 'ncaam_upcoming'):
-                            managers_to_try.append(self.ncaam_upcoming)
-                    
-                    if self.ncaaw_enabled:
-                        if mode_type == 'recent' and hasattr(self, 'ncaaw_recent'):
-                            managers_to_try.append(self.ncaaw_recent)
-                        elif mode_type == 'upcoming' and hasattr(self, 'ncaaw_upcoming'):
-                            managers_to_try.append(self.ncaaw_upcoming)
+                    managers_to_try = self._combined_managers[mode_type]
                 
                 # Try each manager until one returns True (has content)
                 # Don't clear at the start - let the first successful manager clear when it displays
@@ -1140,14 +1267,7 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
                 for current_manager in managers_to_try:
                     if current_manager:
                         # Track which league we're displaying for granular dynamic duration
-                        if hasattr(self, 'nrl_live') and (current_manager == self.nrl_live or current_manager == self.nrl_recent or current_manager == self.nrl_upcoming):
-                            self._current_display_league = 'nrl'
-                        elif hasattr(self, 'wnba_live') and (current_manager == self.wnba_live or current_manager == self.wnba_recent or current_manager == self.wnba_upcoming):
-                            self._current_display_league = 'wnba'
-                        elif hasattr(self, 'ncaam_live') and (current_manager == self.ncaam_live or current_manager == self.ncaam_recent or current_manager == self.ncaam_upcoming):
-                            self._current_display_league = 'ncaam'
-                        elif hasattr(self, 'ncaaw_live') and (current_manager == self.ncaaw_live or current_manager == self.ncaaw_recent or current_manager == self.ncaaw_upcoming):
-                            self._current_display_league = 'ncaaw'
+                        self._current_display_league, _ = self._manager_to_league[id(current_manager)]
                         self._current_display_mode_type = mode_type
                         
                         # Only pass force_clear to the first manager
@@ -1156,7 +1276,7 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
                         first_manager = False
                         
                         # Build actual mode name for tracking
-                        actual_mode = f"{self._current_display_league}_{mode_type}" if self._current_display_league and mode_type else display_mode
+                        actual_mode = f"{self._current_display_league}_{mode_type}"
                         
                         result = current_manager.display(manager_force_clear)
                         # If display returned True, we have content to show
@@ -1186,13 +1306,15 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
                 # No manager had content
                 if not managers_to_try:
                     self.logger.warning(
-                        f"No managers available for mode: {display_mode} "
-                        f"(NRL: {self.nrl_enabled}, WNBA: {self.wnba_enabled}, "
-                        f"NCAA Men's: {self.ncaam_enabled}, NCAA Women's: {self.ncaaw_enabled})"
+                        "No managers available for mode: %s "
+                        "(NRL: %s, WNBA: %s, NCAA Men's: %s, NCAA Women's: %s)",
+                        display_mode, self.nrl_enabled, self.wnba_enabled,
+                        self.ncaam_enabled, self.ncaaw_enabled
                     )
                 else:
                     self.logger.info(
-                        f"No content available for mode: {display_mode} after trying {len(managers_to_try)} manager(s) - returning False"
+                        "No content available for mode: %s after trying %d manager(s) - returning False",
+                        display_mode, len(managers_to_try)
                     )
                 
                 # Don't clear the display when returning False - let the caller handle skipping
@@ -1201,62 +1323,48 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             
             # Fall back to internal mode cycling if no display_mode provided
             current_time = time.time()
+            modes = self.modes
 
             # Check if we should stay on live mode
             should_stay_on_live = False
             if self.has_live_content():
-                # Get current mode name
-                current_mode = self.modes[self.current_mode_index] if self.modes else None
                 # If we're on a live mode, stay there
-                if current_mode and current_mode.endswith('_live'):
+                if self.current_mode_index in self._live_mode_indices:
                     should_stay_on_live = True
-                # If we're not on a live mode but have live content, switch to it
-                elif not (current_mode and current_mode.endswith('_live')):
-                    # Find the first live mode
-                    for i, mode in enumerate(self.modes):
-                        if mode.endswith('_live'):
-                            self.current_mode_index = i
-                            force_clear = True
-                            self.last_mode_switch = current_time
-                            self.logger.info(f"Live content detected - switching to display mode: {mode}")
-                            break
+                # If we're not on a live mode but have live content, jump to the first live mode
+                elif self._first_live_mode_index is not None:
+                    self.current_mode_index = self._first_live_mode_index
+                    force_clear = True
+                    self.last_mode_switch = current_time
+                    self.logger.info(
+                        "Live content detected - switching to display mode: %s",
+                        modes[self.current_mode_index]
+                    )
 
             # Handle mode cycling only if not staying on live
             if not should_stay_on_live and current_time - self.last_mode_switch >= self.display_duration:
-                self.current_mode_index = (self.current_mode_index + 1) % len(
-                    self.modes
-                )
+                self.current_mode_index = (self.current_mode_index + 1) % len(modes)
                 self.last_mode_switch = current_time
                 force_clear = True
+                self.logger.info("Switching to display mode: %s", modes[self.current_mode_index])
 
-                current_mode = self.modes[self.current_mode_index]
-                self.logger.info(f"Switching to display mode: {current_mode}")
+            # The mode index is settled for this tick - resolve the current mode once
+            current_mode = modes[self.current_mode_index] if modes else None
 
             # Get current manager and display
             current_manager = self._get_current_manager()
             if current_manager:
                 # Track which league/mode we're displaying for granular dynamic duration
-                current_mode = self.modes[self.current_mode_index] if self.modes else None
                 if current_mode:
-                    if current_mode.startswith("nrl_"):
-                        self._current_display_league = 'nrl'
-                        self._current_display_mode_type = current_mode.split("_", 1)[1]
-                    elif current_mode.startswith("wnba_"):
-                        self._current_display_league = 'wnba'
-                        self._current_display_mode_type = current_mode.split("_", 1)[1]
-                    elif current_mode.startswith("ncaam_"):
-                        self._current_display_league = 'ncaam'
-                        self._current_display_mode_type = current_mode.split("_", 1)[1]
-                    elif current_mode.startswith("ncaaw_"):
-                        self._current_display_league = 'ncaaw'
-                        self._current_display_mode_type = current_mode.split("_", 1)[1]
+                    league, _, mode_type = current_mode.partition('_')
+                    if league in self._league_registry:
+                        self._current_display_league = league
+                        self._current_display_mode_type = mode_type
                 
                 result = current_manager.display(force_clear)
                 if result is not False:
                     try:
-                        # Build actual mode name for tracking
-                        actual_mode = current_mode
-                        self._record_dynamic_progress(current_manager, actual_mode=actual_mode, display_mode=actual_mode)
+                        self._record_dynamic_progress(current_manager, actual_mode=current_mode, display_mode=current_mode)
                     except Exception as progress_err:
                         self.logger.debug(
                             "Dynamic progress tracking failed: %s", progress_err
@@ -1272,154 +1380,67 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
                 return False
 
         except Exception as e:
-            self.logger.error(f"Error in display method: {e}", exc_info=True)
+            self.logger.error("Error in display method: %s", e, exc_info=True)
             return False
 
     def has_live_priority(self) -> bool:
         if not self.is_enabled:
             return False
-        return (
-            (self.nrl_enabled and self.nrl_live_priority)
-            or (self.wnba_enabled and self.wnba_live_priority)
-            or (self.ncaam_enabled and self.ncaam_live_priority)
-            or (self.ncaaw_enabled and self.ncaaw_live_priority)
+        return self._any_live_priority
+
+    def _compute_live_leagues(self) -> Tuple[str, ...]:
+        """
+        Return live_priority leagues that currently have live content, in priority order.
+        
+        Used by get_live_modes() and has_live_content()'s logging. The result is reused for
+        _live_leagues_cache_interval seconds unless a live_games list has been
+        replaced or resized since it was computed.
+        """
+        # Nothing to scan when no enabled league has live_priority
+        if not self._live_priority_managers:
+            return ()
+        
+        current_time = time.time()
+        signature = tuple(
+            (id(live_manager.live_games), len(live_manager.live_games))
+            for live_manager in self._live_priority_managers
         )
+        cached_at, cached_signature, cached_leagues = self._live_leagues_cache
+        if (current_time - cached_at < self._live_leagues_cache_interval
+                and signature == cached_signature):
+            return cached_leagues
+        
+        live_leagues = tuple(
+            self._manager_to_league[id(live_manager)][0]
+            for live_manager in self._live_priority_managers
+            if self._has_live_games_for_manager(live_manager)
+        )
+        self._live_leagues_cache = (current_time, signature, live_leagues)
+        return live_leagues
 
     def has_live_content(self) -> bool:
         if not self.is_enabled:
             return False
 
-        # Check NRL live content
-        nrl_live = False
-        if (
-            self.nrl_enabled
-            and self.nrl_live_priority
-            and hasattr(self, "nrl_live")
-        ):
-            live_games = getattr(self.nrl_live, "live_games", [])
-            if live_games:
-                # Filter out any games that are final or appear over
-                live_games = [g for g in live_games if not g.get("is_final", False)]
-                # Additional validation using helper method if available
-                if hasattr(self.nrl_live, "_is_game_really_over"):
-                    live_games = [g for g in live_games if not self.nrl_live._is_game_really_over(g)]
-                
-                if live_games:
-                    # If favorite teams are configured, only return True if there are live games for favorite teams
-                    favorite_teams = getattr(self.nrl_live, "favorite_teams", [])
-                    if favorite_teams:
-                        # Check if any live game involves a favorite team
-                        nrl_live = any(
-                            game.get("home_abbr") in favorite_teams
-                            or game.get("away_abbr") in favorite_teams
-                            for game in live_games
-                        )
-                    else:
-                        # No favorite teams configured, return True if any live games exist
-                        nrl_live = True
-
-        # Check WNBA live content
-        wnba_live = False
-        if (
-            self.wnba_enabled
-            and self.wnba_live_priority
-            and hasattr(self, "wnba_live")
-        ):
-            live_games = getattr(self.wnba_live, "live_games", [])
-            if live_games:
-                # Filter out any games that are final or appear over
-                live_games = [g for g in live_games if not g.get("is_final", False)]
-                # Additional validation using helper method if available
-                if hasattr(self.wnba_live, "_is_game_really_over"):
-                    live_games = [g for g in live_games if not self.wnba_live._is_game_really_over(g)]
-                
-                if live_games:
-                    # If favorite teams are configured, only return True if there are live games for favorite teams
-                    favorite_teams = getattr(self.wnba_live, "favorite_teams", [])
-                    if favorite_teams:
-                        # Check if any live game involves a favorite team
-                        wnba_live = any(
-                            game.get("home_abbr") in favorite_teams
-                            or game.get("away_abbr") in favorite_teams
-                            for game in live_games
-                        )
-                    else:
-                        # No favorite teams configured, return True if any live games exist
-                        wnba_live = True
-
-        # Check NCAA Men's live content
-        ncaam_live = False
-        if (
-            self.ncaam_enabled
-            and self.ncaam_live_priority
-            and hasattr(self, "ncaam_live")
-        ):
-            live_games = getattr(self.ncaam_live, "live_games", [])
-            if live_games:
-                # Filter out any games that are final or appear over
-                live_games = [g for g in live_games if not g.get("is_final", False)]
-                # Additional validation using helper method if available
-                if hasattr(self.ncaam_live, "_is_game_really_over"):
-                    live_games = [g for g in live_games if not self.ncaam_live._is_game_really_over(g)]
-                
-                if live_games:
-                    # If favorite teams are configured, only return True if there are live games for favorite teams
-                    favorite_teams = getattr(self.ncaam_live, "favorite_teams", [])
-                    if favorite_teams:
-                        # Check if any live game involves a favorite team
-                        ncaam_live = any(
-                            game.get("home_abbr") in favorite_teams
-                            or game.get("away_abbr") in favorite_teams
-                            for game in live_games
-                        )
-                    else:
-                        # No favorite teams configured, return True if any live games exist
-                        ncaam_live = True
-
-        # Check NCAA Women's live content
-        ncaaw_live = False
-        if (
-            self.ncaaw_enabled
-            and self.ncaaw_live_priority
-            and hasattr(self, "ncaaw_live")
-        ):
-            live_games = getattr(self.ncaaw_live, "live_games", [])
-            if live_games:
-                # Filter out any games that are final or appear over
-                live_games = [g for g in live_games if not g.get("is_final", False)]
-                # Additional validation using helper method if available
-                if hasattr(self.ncaaw_live, "_is_game_really_over"):
-                    live_games = [g for g in live_games if not self.ncaaw_live._is_game_really_over(g)]
-                
-                if live_games:
-                    # If favorite teams are configured, only return True if there are live games for favorite teams
-                    favorite_teams = getattr(self.ncaaw_live, "favorite_teams", [])
-                    if favorite_teams:
-                        # Check if any live game involves a favorite team
-                        ncaaw_live = any(
-                            game.get("home_abbr") in favorite_teams
-                            or game.get("away_abbr") in favorite_teams
-                            for game in live_games
-                        )
-                    else:
-                        # No favorite teams configured, return True if any live games exist
-                        ncaaw_live = True
-
-        result = nrl_live or wnba_live or ncaam_live or ncaaw_live
-        
-        # Throttle logging when returning False to reduce log noise
-        # Always log True immediately (important), but only log False every 60 seconds
-        current_time = time.time()
-        should_log = result or (current_time - self._last_live_content_false_log >= self._live_content_log_interval)
+        # Stop at the first league with live content (per-manager results are cached)
+        result = any(
+            self._has_live_games_for_manager(live_manager)
+            for live_manager in self._live_priority_managers
+        )
         
-        if should_log:
-            if result:
-                # Always log True results immediately
-                self.logger.info(f"has_live_content() returning {result}: nrl_live={nrl_live}, wnba_live={wnba_live}, ncaam_live={ncaam_live}, ncaaw_live={ncaaw_live}")
-            else:
-                # Log False results only every 60 seconds
-                self.logger.info(f"has_live_content() returning {result}: nrl_live={nrl_live}, wnba_live={wnba_live}, ncaam_live={ncaam_live}, ncaaw_live={ncaaw_live}")
-                self._last_live_content_false_log = current_time
+        # Log at INFO only when live state flips; steady-state results go to DEBUG.
+        # The per-league breakdown is only computed when it will be logged.
+        if result != self._last_live_state:
+            self.logger.info(
+                "has_live_content() returning %s: live leagues=%s",
+                result, list(self._compute_live_leagues())
+            )
+            self._last_live_state = result
+        elif self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "has_live_content() returning %s: live leagues=%s",
+                result, list(self._compute_live_leagues())
+            )
         
         return result
 
@@ -1433,140 +1454,11 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         if not self.is_enabled:
             return []
 
-        live_modes = []
-        
-        # Check NRL live content
-        if (
-            self.nrl_enabled
-            and self.nrl_live_priority
-            and hasattr(self, "nrl_live")
-        ):
-            live_games = getattr(self.nrl_live, "live_games", [])
-            if live_games:
-                # Filter out any games that are final or appear over
-                live_games = [g for g in live_games if not g.get("is_final", False)]
-                # Additional validation using helper method if available
-                if hasattr(self.nrl_live, "_is_game_really_over"):
-                    live_games = [g for g in live_games if not self.nrl_live._is_game_really_over(g)]
-                
-                if live_games:
-                    # Check if favorite teams filter applies
-                    favorite_teams = getattr(self.nrl_live, "favorite_teams", [])
-                    if favorite_teams:
-                        # Only include if there are live games for favorite teams
-                        if any(
-                            game.get("home_abbr") in favorite_teams
-                            or game.get("away_abbr") in favorite_teams
-                            for game in live_games
-                        ):
-                            live_modes.append("nrl_live")
-                    else:
-                        # No favorite teams configured, include if any live games exist
-                        live_modes.append("nrl_live")
-        
-        # Check WNBA live content
-        if (
-            self.wnba_enabled
-            and self.wnba_live_priority
-            and hasattr(self, "wnba_live")
-        ):
-            live_games = getattr(self.wnba_live, "live_games", [])
-            if live_games:
-                # Filter out any games that are final or appear over
-                live_games = [g for g in live_games if not g.get("is_final", False)]
-                # Additional validation using helper method if available
-                if hasattr(self.wnba_live, "_is_game_really_over"):
-                    live_games = [g for g in live_games if not self.wnba_live._is_game_really_over(g)]
-                
-                if live_games:
-                    # Check if favorite teams filter applies
-                    favorite_teams = getattr(self.wnba_live, "favorite_teams", [])
-                    if favorite_teams:
-                        # Only include if there are live games for favorite teams
-                        if any(
-                            game.get("home_abbr") in favorite_teams
-                            or game.get("away_abbr") in favorite_teams
-                            for game in live_games
-                        ):
-                            live_modes.append("wnba_live")
-                    else:
-                        # No favorite teams configured, include if any live games exist
-                        live_modes.append("wnba_live")
-        
-        # Check NCAA Men's live content
-        if (
-            self.ncaam_enabled
-            and self.ncaam_live_priority
-            and hasattr(self, "ncaam_live")
-        ):
-            live_games = getattr(self.ncaam_live, "live_games", [])
-            if live_games:
-                # Filter out any games that are final or appear over
-                live_games = [g for g in live_games if not g.get("is_final", False)]
-                # Additional validation using helper method if available
-                if hasattr(self.ncaam_live, "_is_game_really_over"):
-                    live_games = [g for g in live_games if not self.ncaam_live._is_game_really_over(g)]
-                
-                if live_games:
-                    # Check if favorite teams filter applies
-                    favorite_teams = getattr(self.ncaam_live, "favorite_teams", [])
-                    if favorite_teams:
-                        # Only include if there are live games for favorite teams
-                        if any(
-                            game.get("home_abbr") in favorite_teams
-                            or game.get("away_abbr") in favorite_teams
-                            for game in live_games
-                        ):
-                            live_modes.append("ncaam_live")
-                    else:
-                        # No favorite teams configured, include if any live games exist
-                        live_modes.append("ncaam_live")
-        
-        # Check NCAA Women's live content
-        if (
-            self.ncaaw_enabled
-            and self.ncaaw_live_priority
-            and hasattr(self, "ncaaw_live")
-        ):
-            live_games = getattr(self.ncaaw_live, "live_games", [])
-            if live_games:
-                # Filter out any games that are final or appear over
-                live_games = [g for g in live_games if not g.get("is_final", False)]
-                # Additional validation using helper method if available
-                if hasattr(self.ncaaw_live, "_is_game_really_over"):
-                    live_games = [g for g in live_games if not self.ncaaw_live._is_game_really_over(g)]
-                
-                if live_games:
-                    # Check if favorite teams filter applies
-                    favorite_teams = getattr(self.ncaaw_live, "favorite_teams", [])
-                    if favorite_teams:
-                        # Only include if there are live games for favorite teams
-                        if any(
-                            game.get("home_abbr") in favorite_teams
-                            or game.get("away_abbr") in favorite_teams
-                            for game in live_games
-                        ):
-                            live_modes.append("ncaaw_live")
-                    else:
-                        # No favorite teams configured, include if any live games exist
-                        live_modes.append("ncaaw_live")
-        
-        return live_modes
+        return [f"{league_id}_live" for league_id in self._compute_live_leagues()]
 
-    def _should_use_scroll_mode(self, league: str, mode_type: str) -> bool:
-        """
-        Check if a specific league should use scroll mode for this game type.
-        
-        Args:
-            league: League ID ('nrl', 'wnba', 'ncaam', or 'ncaaw')
-            mode_type: 'live', 'recent', or 'upcoming'
-            
-        Returns:
-            True if this league uses scroll mode for this game type
-        """
-        return self._get_display_mode(league, mode_type) == 'scroll'
-
-    def _display_scroll_mode(self, display_mode: str, league: str, mode_type: str, force_clear: bool) -> bool:
+    def _display_scroll_mode(
+        self, display_mode: str, league: str, mode_type: str, force_clear: bool, manager=None
+    ) -> bool:
         """Handle display for scroll mode (single league).
         
         Args:
@@ -1574,15 +1466,20 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             league: League ID ('nrl', 'wnba', 'ncaam', or 'ncaaw')
             mode_type: Game type ('live', 'recent', 'upcoming')
             force_clear: Whether to force clear display
+            manager: League manager for this mode, if the caller already resolved it
             
         Returns:
             True if content was displayed, False otherwise
         """
+        # Resolve the manager once for both the fallback and the scroll path
+        if manager is None:
+            manager = self._get_league_manager_for_mode(league, mode_type)
+        
         if not self._scroll_manager:
             self.logger.warning("Scroll mode requested but scroll manager not available")
             # Fall back to switch mode
             return self._try_manager_display(
-                self._get_league_manager_for_mode(league, mode_type),
+                manager,
                 force_clear,
                 display_mode,
                 mode_type,
@@ -1590,13 +1487,14 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             )[0]
         
         # Check if we need to prepare new scroll content
-        scroll_key = f"{display_mode}_{mode_type}"
+        scroll_key = (display_mode, mode_type)
+        scroll_prepared = self._scroll_prepared
+        scroll_active = self._scroll_active
         
-        if not self._scroll_prepared.get(scroll_key, False):
-            # Get manager and update it
-            manager = self._get_league_manager_for_mode(league, mode_type)
+        if not scroll_prepared.get(scroll_key, False):
+            # Update the manager before preparing content
             if not manager:
-                self.logger.debug(f"No manager available for {league} {mode_type}")
+                self.logger.debug("No manager available for %s %s", league, mode_type)
                 return False
             
             self._ensure_manager_updated(manager)
@@ -1605,9 +1503,9 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             games = self._get_games_from_manager(manager, mode_type)
             
             if not games:
-                self.logger.debug(f"No games to scroll for {display_mode}")
-                self._scroll_prepared[scroll_key] = False
-                self._scroll_active[scroll_key] = False
+                self.logger.debug("No games to scroll for %s", display_mode)
+                scroll_prepared[scroll_key] = False
+                scroll_active[scroll_key] = False
                 return False
             
             # Add league info to each game
@@ -1623,34 +1521,35 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             )
             
             if success:
-                self._scroll_prepared[scroll_key] = True
-                self._scroll_active[scroll_key] = True
+                scroll_prepared[scroll_key] = True
+                scroll_active[scroll_key] = True
                 self.logger.info(
-                    f"[Rugby League Scroll] Started scrolling {len(games)} {league} {mode_type} games"
+                    "[Rugby League Scroll] Started scrolling %d %s %s games",
+                    len(games), league, mode_type
                 )
             else:
-                self._scroll_prepared[scroll_key] = False
-                self._scroll_active[scroll_key] = False
+                scroll_prepared[scroll_key] = False
+                scroll_active[scroll_key] = False
                 return False
         
         # Display the next scroll frame
-        if self._scroll_active.get(scroll_key, False):
+        if scroll_active.get(scroll_key, False):
             displayed = self._scroll_manager.display_frame(mode_type)
             
             if displayed:
                 # Check if scroll is complete
                 if self._scroll_manager.is_complete(mode_type):
-                    self.logger.info(f"[Rugby League Scroll] Cycle complete for {display_mode}")
+                    self.logger.info("[Rugby League Scroll] Cycle complete for %s", display_mode)
                     # Reset for next cycle
-                    self._scroll_prepared[scroll_key] = False
-                    self._scroll_active[scroll_key] = False
+                    scroll_prepared[scroll_key] = False
+                    scroll_active[scroll_key] = False
                     # Mark cycle as complete for dynamic duration
                     self._dynamic_cycle_complete = True
                 
                 return True
             else:
                 # Scroll display failed
-                self._scroll_active[scroll_key] = False
+                scroll_active[scroll_key] = False
                 return False
         
         return False
@@ -1672,26 +1571,26 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         """
         # Validate league
         if league not in self._league_registry:
-            self.logger.warning(f"Invalid league in _display_league_mode: {league}")
+            self.logger.warning("Invalid league in _display_league_mode: %s", league)
             return False
         
         # Check if league is enabled
         if not self._league_registry[league].get('enabled', False):
-            self.logger.debug(f"League {league} is disabled, skipping")
+            self.logger.debug("League %s is disabled, skipping", league)
             return False
         
         # Get manager for this league/mode combination
         manager = self._get_league_manager_for_mode(league, mode_type)
         if not manager:
-            self.logger.debug(f"No manager available for {league} {mode_type}")
+            self.logger.debug("No manager available for %s %s", league, mode_type)
             return False
         
         # Create display mode name for tracking
         display_mode = f"{league}_{mode_type}"
         
         # Check if this league uses scroll mode
-        if self._should_use_scroll_mode(league, mode_type):
-            return self._display_scroll_mode(display_mode, league, mode_type, force_clear)
+        if (league, mode_type) in self._scroll_mode_keys:
+            return self._display_scroll_mode(display_mode, league, mode_type, force_clear, manager)
         
         # Set display context for dynamic duration tracking
         self._current_display_league = league
@@ -1704,37 +1603,40 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         
         # Only track mode start time and check duration if we actually have content to display
         if success:
+            # One clock read per frame for start tracking and expiry checks
+            current_time = time.time()
+            
             # Track mode start time for per-mode duration enforcement (only when content exists)
             if display_mode not in self._mode_start_time:
-                self._mode_start_time[display_mode] = time.time()
-                self.logger.debug(f"Started tracking time for {display_mode}")
+                self._mode_start_time[display_mode] = current_time
+                self.logger.debug("Started tracking time for %s", display_mode)
             
             # Check if mode-level duration has expired (only check if we have content)
             effective_mode_duration = self._get_effective_mode_duration(display_mode, mode_type)
             if effective_mode_duration is not None:
-                elapsed_time = time.time() - self._mode_start_time[display_mode]
+                elapsed_time = current_time - self._mode_start_time[display_mode]
                 if elapsed_time >= effective_mode_duration:
                     # Mode duration expired - time to rotate
                     self.logger.info(
-                        f"Mode duration expired for {display_mode}: "
-                        f"{elapsed_time:.1f}s >= {effective_mode_duration}s. "
-                        f"Rotating to next mode (progress preserved for resume)."
+                        "Mode duration expired for %s: %.1fs >= %ss. "
+                        "Rotating to next mode (progress preserved for resume).",
+                        display_mode, elapsed_time, effective_mode_duration
                     )
                     # Reset mode start time for next cycle
-                    self._mode_start_time[display_mode] = time.time()
+                    self._mode_start_time[display_mode] = current_time
                     return False
             
             self.logger.debug(
-                f"Displayed content from {league} {mode_type} (mode: {display_mode})"
+                "Displayed content from %s %s (mode: %s)", league, mode_type, display_mode
             )
         else:
             # No content - clear any existing start time so mode can start fresh when content becomes available
             if display_mode in self._mode_start_time:
                 del self._mode_start_time[display_mode]
-                self.logger.debug(f"Cleared mode start time for {display_mode} (no content available)")
+                self.logger.debug("Cleared mode start time for %s (no content available)", display_mode)
             
             self.logger.debug(
-                f"No content available for {league} {mode_type} (mode: {display_mode})"
+                "No content available for %s %s (mode: %s)", league, mode_type, display_mode
             )
         
         return success
@@ -1749,43 +1651,39 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             True if content was displayed, False otherwise
         """
         current_time = time.time()
+        modes = self.modes
+        logger = self.logger
         
         # Check if we should stay on live mode
         should_stay_on_live = False
         if self.has_live_content():
-            # Get current mode name
-            current_mode = self.modes[self.current_mode_index] if self.modes else None
             # If we're on a live mode, stay there
-            if current_mode and current_mode.endswith('_live'):
+            if self.current_mode_index in self._live_mode_indices:
                 should_stay_on_live = True
-            # If we're not on a live mode but have live content, switch to it
-            elif not (current_mode and current_mode.endswith('_live')):
-                # Find the first live mode
-                for i, mode in enumerate(self.modes):
-                    if mode.endswith('_live'):
-                        self.current_mode_index = i
-                        force_clear = True
-                        self.last_mode_switch = current_time
-                        self.logger.info(f"Live content detected - switching to display mode: {mode}")
-                        break
+            # If we're not on a live mode but have live content, jump to the first live mode
+            elif self._first_live_mode_index is not None:
+                self.current_mode_index = self._first_live_mode_index
+                force_clear = True
+                self.last_mode_switch = current_time
+                logger.info("Live content detected - switching to display mode: %s", modes[self.current_mode_index])
         
         # Handle mode cycling only if not staying on live
         if not should_stay_on_live and current_time - self.last_mode_switch >= self.display_duration:
-            self.current_mode_index = (self.current_mode_index + 1) % len(self.modes)
+            self.current_mode_index = (self.current_mode_index + 1) % len(modes)
             self.last_mode_switch = current_time
             force_clear = True
-            
-            current_mode = self.modes[self.current_mode_index]
-            self.logger.info(f"Switching to display mode: {current_mode}")
+            logger.info("Switching to display mode: %s", modes[self.current_mode_index])
+        
+        # The mode index is settled for this tick - resolve the current mode once
+        current_mode = modes[self.current_mode_index] if modes else None
         
         # Get current manager and display
         current_manager = self._get_current_manager()
         if not current_manager:
-            self.logger.warning("No manager available for current mode")
+            logger.warning("No manager available for current mode")
             return False
         
         # Track which league/mode we're displaying for granular dynamic duration
-        current_mode = self.modes[self.current_mode_index] if self.modes else None
         if current_mode:
             # Extract mode type from mode name
             mode_type = self._extract_mode_type(current_mode)
@@ -1795,18 +1693,16 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         result = current_manager.display(force_clear)
         if result is not False:
             try:
-                # Build the actual mode name from league and mode_type for accurate tracking
-                current_mode = self.modes[self.current_mode_index] if self.modes else None
                 if current_mode:
                     manager_key = self._build_manager_key(current_mode, current_manager)
                     # Track which managers were used for internal mode cycling
                     # For internal cycling, the mode itself is the display_mode
-                    self._display_mode_to_managers.setdefault(current_mode, set()).add(manager_key)
+                    self._display_mode_to_managers[current_mode].add(manager_key)
                 self._record_dynamic_progress(
                     current_manager, actual_mode=current_mode, display_mode=current_mode
                 )
             except Exception as progress_err:  # pylint: disable=broad-except
-                self.logger.debug(f"Dynamic progress tracking failed: {progress_err}")
+                logger.debug("Dynamic progress tracking failed: %s", progress_err)
         else:
             # Manager returned False (no content) - ensure display is cleared
             # This is a safety measure in case the manager didn't clear it
@@ -1815,9 +1711,8 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
                     self.display_manager.clear()
                     self.display_manager.update_display()
                 except Exception as clear_err:
-                    self.logger.debug(f"Error clearing display when manager returned False: {clear_err}")
+                    logger.debug("Error clearing display when manager returned False: %s", clear_err)
         
-        current_mode = self.modes[self.current_mode_index] if self.modes else None
         self._evaluate_dynamic_cycle_completion(display_mode=current_mode)
         return result
 
@@ -1830,26 +1725,9 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         """
         self._current_display_mode_type = mode_type
         
-        # Check NRL managers
-        if manager in (getattr(self, 'nrl_live', None), 
-                      getattr(self, 'nrl_recent', None), 
-                      getattr(self, 'nrl_upcoming', None)):
-            self._current_display_league = 'nrl'
-        # Check WNBA managers
-        elif manager in (getattr(self, 'wnba_live', None), 
-                        getattr(self, 'wnba_recent', None), 
-                        getattr(self, 'wnba_upcoming', None)):
-            self._current_display_league = 'wnba'
-        # Check NCAA Men's managers
-        elif manager in (getattr(self, 'ncaam_live', None), 
-                        getattr(self, 'ncaam_recent', None), 
-                        getattr(self, 'ncaam_upcoming', None)):
-            self._current_display_league = 'ncaam'
-        # Check NCAA Women's managers
-        elif manager in (getattr(self, 'ncaaw_live', None), 
-                        getattr(self, 'ncaaw_recent', None), 
-                        getattr(self, 'ncaaw_upcoming', None)):
-            self._current_display_league = 'ncaaw'
+        owner = self._manager_to_league.get(id(manager))
+        if owner is not None:
+            self._current_display_league = owner[0]
 
     def _try_manager_display(
         self, 
@@ -1885,6 +1763,7 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         # This sets _current_display_league and _current_display_mode_type
         # which are used for progress tracking and duration calculations
         self._set_display_context_from_manager(manager, mode_type)
+        display_league = self._current_display_league
         
         # Ensure manager is updated before displaying
         # This fetches fresh data if needed based on update intervals
@@ -1898,67 +1777,27 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         # This is used to track progress per league separately
         # Example: 'nrl_recent' or 'wnba_live'
         actual_mode = (
-            f"{self._current_display_league}_{mode_type}" 
-            if self._current_display_league and mode_type 
+            f"{display_league}_{mode_type}" 
+            if display_league and mode_type 
             else display_mode
         )
         
-        # Track game transitions for logging
-        # Only log at DEBUG level for frequent calls, INFO for game transitions
         manager_class_name = manager.__class__.__name__
-        has_current_game = hasattr(manager, 'current_game') and manager.current_game is not None
-        current_game = getattr(manager, 'current_game', None) if has_current_game else None
-        
-        # Get current game ID for transition detection
-        current_game_id = None
-        if current_game:
-            current_game_id = current_game.get('id') or current_game.get('game_id')
-            if not current_game_id:
-                # Fallback: create ID from team abbreviations
-                away = current_game.get('away_abbr', '')
-                home = current_game.get('home_abbr', '')
-                if away and home:
-                    current_game_id = f"{away}@{home}"
         
-        # Check for game transition
-        game_tracking = self._current_game_tracking.get(display_mode, {})
-        last_game_id = game_tracking.get('game_id')
-        last_league = game_tracking.get('league')
-        last_log_time = game_tracking.get('last_log_time', 0.0)
+        # Track game transitions for logging
+        # Only log at DEBUG level for frequent calls, INFO for game transitions
         current_time = time.time()
-        
-        # Detect game transition or league change
-        game_changed = (current_game_id and current_game_id != last_game_id)
-        league_changed = (self._current_display_league and self._current_display_league != last_league)
-        time_since_last_log = current_time - last_log_time
-        
-        # Log game transitions at INFO level (but throttle to avoid spam)
-        if (game_changed or league_changed) and time_since_last_log >= self._game_transition_log_interval:
-            if game_changed and current_game_id:
-                away_abbr = current_game.get('away_abbr', '?') if current_game else '?'
-                home_abbr = current_game.get('home_abbr', '?') if current_game else '?'
-                self.logger.info(
-                    f"Game transition in {display_mode}: "
-                    f"{away_abbr} @ {home_abbr} "
-                    f"({self._current_display_league or 'unknown'} {mode_type})"
-                )
-            elif league_changed and self._current_display_league:
-                self.logger.info(
-                    f"League transition in {display_mode}: "
-                    f"switched to {self._current_display_league} {mode_type}"
-                )
-            
-            # Update tracking
-            self._current_game_tracking[display_mode] = {
-                'game_id': current_game_id,
-                'league': self._current_display_league,
-                'last_log_time': current_time
-            }
-        else:
-            # Frequent calls - only log at DEBUG level
-            self.logger.debug(
-                f"Manager {manager_class_name} display() returned {result}, "
-                f"has_current_game={has_current_game}, game_id={current_game_id}"
+        game_tracking = self._current_game_tracking.get(display_mode)
+        transition_log_due = (
+            not game_tracking
+            or current_time - game_tracking.get('last_log_time', 0.0) >= self._game_transition_log_interval
+        )
+        # While transition logging is throttled and DEBUG is off, nothing below
+        # would be logged or recorded, so skip building the game ID entirely
+        if transition_log_due or self.logger.isEnabledFor(logging.DEBUG):
+            self._log_game_transition(
+                manager, result, display_mode, display_league, mode_type,
+                game_tracking or {}, transition_log_due, current_time
             )
         
         if result is True:
@@ -1968,17 +1807,23 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             try:
                 self._record_dynamic_progress(manager, actual_mode=actual_mode, display_mode=display_mode)
             except Exception as progress_err:  # pylint: disable=broad-except
-                self.logger.debug(f"Dynamic progress tracking failed: {progress_err}")
+                self.logger.debug("Dynamic progress tracking failed: %s", progress_err)
             
             # Set as sticky manager AFTER progress tracking (which may clear it on new cycle)
             if display_mode not in self._sticky_manager_per_mode:
                 self._sticky_manager_per_mode[display_mode] = manager
-                self._sticky_manager_start_time[display_mode] = time.time()
-                self.logger.info(f"Set sticky manager {manager_class_name} for {display_mode}")
+                self._sticky_manager_start_time[display_mode] = current_time
+                # Sticky managers are cleared and re-set often; log each pair once per cycle
+                sticky_log_key = (display_mode, manager_class_name)
+                if sticky_log_key in self._sticky_logged:
+                    self.logger.debug("Set sticky manager %s for %s", manager_class_name, display_mode)
+                else:
+                    self._sticky_logged.add(sticky_log_key)
+                    self.logger.info("Set sticky manager %s for %s", manager_class_name, display_mode)
             
             # Track which managers were used for this display mode
             if display_mode:
-                self._display_mode_to_managers.setdefault(display_mode, set()).add(manager_key)
+                self._display_mode_to_managers[display_mode].add(manager_key)
             
             self._evaluate_dynamic_cycle_completion(display_mode=display_mode)
             return True, actual_mode
@@ -1989,7 +1834,7 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             
             if manager_key in self._dynamic_managers_completed:
                 self.logger.info(
-                    f"Sticky manager {manager_class_name} completed all games, switching to next manager"
+                    "Sticky manager %s completed all games, switching to next manager", manager_class_name
                 )
                 self._sticky_manager_per_mode.pop(display_mode, None)
                 self._sticky_manager_start_time.pop(display_mode, None)
@@ -1998,7 +1843,7 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             else:
                 # Manager not done yet, just returning False temporarily (between game switches)
                 self.logger.debug(
-                    f"Sticky manager {manager_class_name} returned False (between games), continuing"
+                    "Sticky manager %s returned False (between games), continuing", manager_class_name
                 )
                 return False, None
         
@@ -2013,15 +1858,67 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             try:
                 self._record_dynamic_progress(manager, actual_mode=actual_mode, display_mode=display_mode)
             except Exception as progress_err:  # pylint: disable=broad-except
-                self.logger.debug(f"Dynamic progress tracking failed: {progress_err}")
+                self.logger.debug("Dynamic progress tracking failed: %s", progress_err)
             
             # Track which managers were used for this display mode
             if display_mode:
-                self._display_mode_to_managers.setdefault(display_mode, set()).add(manager_key)
+                self._display_mode_to_managers[display_mode].add(manager_key)
             
             self._evaluate_dynamic_cycle_completion(display_mode=display_mode)
             return True, actual_mode
 
+    def _log_game_transition(
+        self, manager, result, display_mode: str, display_league: Optional[str],
+        mode_type: Optional[str], game_tracking: Dict[str, Any],
+        transition_log_due: bool, current_time: float
+    ) -> None:
+        """Log game/league transitions at INFO (throttled) and other display calls at DEBUG."""
+        current_game = getattr(manager, 'current_game', None)
+        has_current_game = current_game is not None
+        
+        # Get current game ID for transition detection
+        current_game_id = None
+        if current_game:
+            current_game_id = current_game.get('id') or current_game.get('game_id')
+            if not current_game_id:
+                # Fallback: create ID from team abbreviations
+                away = current_game.get('away_abbr', '')
+                home = current_game.get('home_abbr', '')
+                if away and home:
+                    current_game_id = f"{away}@{home}"
+        
+        # Detect game transition or league change
+        game_changed = (current_game_id and current_game_id != game_tracking.get('game_id'))
+        league_changed = (display_league and display_league != game_tracking.get('league'))
+        
+        # Log game transitions at INFO level (but throttle to avoid spam)
+        if (game_changed or league_changed) and transition_log_due:
+            if game_changed and current_game_id:
+                away_abbr = current_game.get('away_abbr', '?') if current_game else '?'
+                home_abbr = current_game.get('home_abbr', '?') if current_game else '?'
+                self.logger.info(
+                    "Game transition in %s: %s @ %s (%s %s)",
+                    display_mode, away_abbr, home_abbr, display_league or 'unknown', mode_type
+                )
+            elif league_changed and display_league:
+                self.logger.info(
+                    "League transition in %s: switched to %s %s",
+                    display_mode, display_league, mode_type
+                )
+            
+            # Update tracking
+            self._current_game_tracking[display_mode] = {
+                'game_id': current_game_id,
+                'league': display_league,
+                'last_log_time': current_time
+            }
+        else:
+            # Frequent calls - only log at DEBUG level
+            self.logger.debug(
+                "Manager %s display() returned %s, has_current_game=%s, game_id=%s",
+                manager.__class__.__name__, result, has_current_game, current_game_id
+            )
+
     def _get_effective_mode_duration(self, display_mode: str, mode_type: str) -> Optional[float]:
         """
         Get effective mode duration for a display mode.
@@ -2035,19 +1932,20 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         Returns:
             Mode duration in seconds (float) or None to use dynamic calculation
         """
-        if not self._current_display_league:
-            return None
-        
-        # Get mode duration from config
-        mode_duration = self._get_mode_duration(self._current_display_league, mode_type)
-        if mode_duration is not None:
-            return mode_duration
-        
-        # No per-mode duration configured - use dynamic calculation
-        return None
+        # Per-mode durations are flattened at config load (see _rebuild_config_caches);
+        # a miss means no per-mode duration configured - use dynamic calculation
+        return self._mode_duration_flat.get((self._current_display_league, mode_type))
 
     def _ensure_manager_updated(self, manager) -> None:
         """Trigger an update when the delegated manager is stale."""
+        # Called from tight display/duration loops; check each manager at most
+        # once per _update_check_interval (update() keeps its own update_interval)
+        now = time.time()
+        manager_key = id(manager)
+        if now - self._last_update_check.get(manager_key, 0.0) < self._update_check_interval:
+            return
+        self._last_update_check[manager_key] = now
+        
         last_update = getattr(manager, "last_update", None)
         update_interval = getattr(manager, "update_interval", None)
         if last_update is None or update_interval is None:
@@ -2060,10 +1958,10 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             interval = no_data_interval
 
         try:
-            if interval and time.time() - last_update >= interval:
+            if interval and now - last_update >= interval:
                 manager.update()
         except Exception as exc:
-            self.logger.debug(f"Auto-refresh failed for manager {manager}: {exc}")
+            self.logger.debug("Auto-refresh failed for manager %s: %s", manager, exc)
 
     def get_cycle_duration(self, display_mode: str = None) -> Optional[float]:
         """
@@ -2075,7 +1973,8 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         
         Priority order:
         1. Mode-level duration (if configured)
-        2. Dynamic calculation (if no mode-level duration)
+        2. Dynamic calculation (if no mode-level duration and dynamic duration is
+           enabled for the league/mode; otherwise None)
         3. Dynamic duration cap applies to both if enabled
         
         Args:
@@ -2084,66 +1983,77 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         Returns:
             Total expected duration in seconds, or None if not applicable
         """
-        self.logger.info(f"get_cycle_duration() called with display_mode={display_mode}, is_enabled={self.is_enabled}")
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            self.logger.debug(
+                "get_cycle_duration() called with display_mode=%s, is_enabled=%s",
+                display_mode, self.is_enabled
+            )
         if not self.is_enabled or not display_mode:
-            self.logger.info(f"get_cycle_duration() returning None: is_enabled={self.is_enabled}, display_mode={display_mode}")
+            if debug_enabled:
+                self.logger.debug(
+                    "get_cycle_duration() returning None: is_enabled=%s, display_mode=%s",
+                    self.is_enabled, display_mode
+                )
             return None
         
+        # Reuse a very recent result for the same mode and display league
+        current_time = time.time()
+        cache_key = (display_mode, self._current_display_league)
+        cached = self._cycle_duration_cache.get(cache_key)
+        if cached is not None and current_time - cached[0] < self._cycle_duration_ttl:
+            return cached[1]
+        
+        duration = self._compute_cycle_duration(display_mode, debug_enabled)
+        self._cycle_duration_cache[cache_key] = (current_time, duration)
+        return duration
+
+    def _compute_cycle_duration(self, display_mode: str, debug_enabled: bool) -> Optional[float]:
+        """Compute get_cycle_duration() for an enabled plugin and non-empty display_mode."""
         # Extract mode type and league (if granular mode)
         mode_type = self._extract_mode_type(display_mode)
         if not mode_type:
             return None
         
         # Parse granular mode name if applicable (e.g., "nrl_recent", "wnba_upcoming")
-        league = None
-        if "_" in display_mode and not display_mode.startswith("nrl_"):
-            # Granular mode: extract league
-            # Handle ncaam and ncaaw with multiple underscores
-            if display_mode.startswith("ncaam_"):
-                league = "ncaam"
-            elif display_mode.startswith("ncaaw_"):
-                league = "ncaaw"
-            elif display_mode.startswith("nrl_"):
-                league = "nrl"
-            elif display_mode.startswith("wnba_"):
-                league = "wnba"
-            else:
-                # Try standard split
-                parts = display_mode.split("_", 1)
-                if len(parts) == 2:
-                    potential_league, potential_mode_type = parts
-                    if potential_league in self._league_registry and potential_mode_type == mode_type:
-                        league = potential_league
-        
-        # Check for mode-level duration first (priority 1)
-        # Extract league if not already determined
-        if not league and mode_type:
-            # Try to get league from current display context or parse from display_mode
-            if self._current_display_league:
-                league = self._current_display_league
-            else:
-                # Try to parse from display_mode
-                if display_mode.startswith("nrl_"):
-                    league = "nrl"
-                elif display_mode.startswith("wnba_"):
-                    league = "wnba"
-                elif display_mode.startswith("ncaam_"):
-                    league = "ncaam"
-                elif display_mode.startswith("ncaaw_"):
-                    league = "ncaaw"
+        prefix, _, rest = display_mode.partition('_')
+        if prefix in self._league_registry and rest == mode_type:
+            league = prefix
+        else:
+            # Combined mode: use the league currently being displayed for mode-level duration,
+            # falling back to a known league prefix
+            league = self._current_display_league or (
+                prefix if prefix in self._league_registry else None
+            )
         
         if league:
             effective_mode_duration = self._get_mode_duration(league, mode_type)
             if effective_mode_duration is not None:
-                self.logger.info(
-                    f"get_cycle_duration: using mode-level duration for {display_mode} = {effective_mode_duration}s"
-                )
+                if debug_enabled:
+                    self.logger.debug(
+                        "get_cycle_duration: using mode-level duration for %s = %ss",
+                        display_mode, effective_mode_duration
+                    )
                 return effective_mode_duration
+            
+            # Dynamic duration is off for this league/mode, so the game-count
+            # result would go unused; skip updating managers and counting games
+            if not self._dynamic_enabled_flat.get((league, mode_type), False):
+                if debug_enabled:
+                    self.logger.debug(
+                        "get_cycle_duration: dynamic duration disabled for %s %s, returning None",
+                        league, mode_type
+                    )
+                return None
         
         # Fall through to dynamic calculation based on game count (priority 2)
         
         try:
-            self.logger.info(f"get_cycle_duration: extracted mode_type={mode_type}, league={league} from display_mode={display_mode}")
+            if debug_enabled:
+                self.logger.debug(
+                    "get_cycle_duration: extracted mode_type=%s, league=%s from display_mode=%s",
+                    mode_type, league, display_mode
+                )
             
             total_games = 0
             per_game_duration = self.game_display_duration  # Default fallback (will be overridden per league)
@@ -2157,128 +2067,92 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
                 if manager:
                     managers_to_check.append((league, manager))
             else:
-                # Combined mode - check all enabled leagues
-                if mode_type == 'live':
-                    if self.nrl_enabled:
-                        nrl_manager = self._get_league_manager_for_mode('nrl', 'live')
-                        if nrl_manager:
-                            managers_to_check.append(('nrl', nrl_manager))
-                    if self.wnba_enabled:
-                        wnba_manager = self._get_league_manager_for_mode('wnba', 'live')
-                        if wnba_manager:
-                            managers_to_check.append(('wnba', wnba_manager))
-                    if self.ncaam_enabled:
-                        ncaam_manager = self._get_league_manager_for_mode('ncaam', 'live')
-                        if ncaam_manager:
-                            managers_to_check.append(('ncaam', ncaam_manager))
-                    if self.ncaaw_enabled:
-                        ncaaw_manager = self._get_league_manager_for_mode('ncaaw', 'live')
-                        if ncaaw_manager:
-                            managers_to_check.append(('ncaaw', ncaaw_manager))
-                elif mode_type == 'recent':
-                    if self.nrl_enabled:
-                        nrl_manager = self._get_league_manager_for_mode('nrl', 'recent')
-                        if nrl_manager:
-                            managers_to_check.append(('nrl', nrl_manager))
-                    if self.wnba_enabled:
-                        wnba_manager = self._get_league_manager_for_mode('wnba', 'recent')
-                        if wnba_manager:
-                            managers_to_check.append(('wnba', wnba_manager))
-                    if self.ncaam_enabled:
-                        ncaam_manager = self._get_league_manager_for_mode('ncaam', 'recent')
-                        if ncaam_manager:
-                            managers_to_check.append(('ncaam', ncaam_manager))
-                    if self.ncaaw_enabled:
-                        ncaaw_manager = self._get_league_manager_for_mode('ncaaw', 'recent')
-                        if ncaaw_manager:
-                            managers_to_check.append(('ncaaw', ncaaw_manager))
-                elif mode_type == 'upcoming':
-                    if self.nrl_enabled:
-                        nrl_manager = self._get_league_manager_for_mode('nrl', 'upcoming')
-                        if nrl_manager:
-                            managers_to_check.append(('nrl', nrl_manager))
-                    if self.wnba_enabled:
-                        wnba_manager = self._get_league_manager_for_mode('wnba', 'upcoming')
-                        if wnba_manager:
-                            managers_to_check.append(('wnba', wnba_manager))
-                    if self.ncaam_enabled:
-                        ncaam_manager = self._get_league_manager_for_mode('ncaam', 'upcoming')
-                        if ncaam_manager:
-                            managers_to_check.append(('ncaam', ncaam_manager))
-                    if self.ncaaw_enabled:
-                        ncaaw_manager = self._get_league_manager_for_mode('ncaaw', 'upcoming')
-                        if ncaaw_manager:
-                            managers_to_check.append(('ncaaw', ncaaw_manager))
+                # Combined mode - check all enabled leagues, in priority order
+                mode_index = _MODE_TYPE_ORDER.index(mode_type)
+                managers_to_check = [
+                    (league_id, managers[mode_index])
+                    for league_id, managers in self._league_managers.items()
+                    if managers[mode_index] is not None
+                ]
             
             # CRITICAL: Update managers BEFORE checking game counts!
-            self.logger.info(f"get_cycle_duration: updating {len(managers_to_check)} manager(s) before counting games")
+            if debug_enabled:
+                self.logger.debug(
+                    "get_cycle_duration: updating %d manager(s) before counting games",
+                    len(managers_to_check)
+                )
             for league_name, manager in managers_to_check:
                 if manager:
                     self._ensure_manager_updated(manager)
             
             # Count games from all applicable managers and get duration
+            games_attrs = _GAMES_ATTRS[mode_type]
             for league_name, manager in managers_to_check:
                 if not manager:
                     continue
                 
-                # Get the appropriate game list based on mode type
-                if mode_type == 'live':
-                    games = getattr(manager, 'live_games', [])
-                elif mode_type == 'recent':
-                    # Try games_list first (used by recent managers), then recent_games
-                    games = getattr(manager, 'games_list', None)
-                    if games is None:
-                        games = getattr(manager, 'recent_games', [])
-                    else:
-                        games = list(games) if games else []
-                elif mode_type == 'upcoming':
-                    # Try games_list first (used by upcoming managers), then upcoming_games
-                    games = getattr(manager, 'games_list', None)
-                    if games is None:
-                        games = getattr(manager, 'upcoming_games', [])
-                    else:
-                        games = list(games) if games else []
-                else:
-                    games = []
+                # Get the appropriate game list based on mode type (games_list is
+                # used by recent/upcoming managers); only the count is needed, so
+                # the lists are never copied
+                for games_attr in games_attrs:
+                    games = getattr(manager, games_attr, None)
+                    if games is not None:
+                        break
+                games = games or ()
                 
                 # Get duration for this league/mode combination
                 per_game_duration = self._get_game_duration(league_name, mode_type, manager)
                 
                 # Filter out invalid games
                 if games:
-                    # For live games, filter out final games
+                    # For live games, skip final games without building filtered lists
                     if mode_type == 'live':
-                        games = [g for g in games if not g.get('is_final', False)]
-                        if hasattr(manager, '_is_game_really_over'):
-                            games = [g for g in games if not manager._is_game_really_over(g)]
-                    
-                    game_count = len(games)
+                        is_over = getattr(manager, '_is_game_really_over', None)
+                        if is_over:
+                            game_count = sum(
+                                1 for g in games
+                                if not g.get('is_final', False) and not is_over(g)
+                            )
+                        else:
+                            game_count = sum(1 for g in games if not g.get('is_final', False))
+                    else:
+                        game_count = len(games)
                     total_games += game_count
                     
-                    self.logger.debug(
-                        f"get_cycle_duration: {league_name} {mode_type} has {game_count} games, "
-                        f"per_game_duration={per_game_duration}s"
-                    )
+                    if debug_enabled:
+                        self.logger.debug(
+                            "get_cycle_duration: %s %s has %d games, per_game_duration=%ss",
+                            league_name, mode_type, game_count, per_game_duration
+                        )
             
-            self.logger.info(f"get_cycle_duration: found {total_games} total games for {display_mode}")
+            if debug_enabled:
+                self.logger.debug(
+                    "get_cycle_duration: found %d total games for %s", total_games, display_mode
+                )
             
             if total_games == 0:
                 # If no games found yet (managers still fetching data), return a default duration
                 # This allows the display to start while data is loading
                 default_duration = 45.0  # 3 games × 15s per game (reasonable default)
-                self.logger.info(f"get_cycle_duration: {display_mode} has no games yet, returning default {default_duration}s")
+                if debug_enabled:
+                    self.logger.debug(
+                        "get_cycle_duration: %s has no games yet, returning default %ss",
+                        display_mode, default_duration
+                    )
                 return default_duration
             
             # Calculate total duration: num_games × per_game_duration
             total_duration = total_games * per_game_duration
-            self.logger.info(
-                f"get_cycle_duration({display_mode}): {total_games} games × {per_game_duration}s = {total_duration}s"
-            )
+            if debug_enabled:
+                self.logger.debug(
+                    "get_cycle_duration(%s): %d games × %ss = %ss",
+                    display_mode, total_games, per_game_duration, total_duration
+                )
             
             return total_duration
             
         except Exception as e:
-            self.logger.error(f"Error calculating cycle duration for {display_mode}: {e}", exc_info=True)
+            self.logger.error("Error calculating cycle duration for %s: %s", display_mode, e, exc_info=True)
             return None
 
     def get_info(self) -> Dict[str, Any]:
@@ -2323,18 +2197,7 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
                 if current_manager
                 else None,
                 "managers_initialized": {
-                    "nrl_live": hasattr(self, "nrl_live"),
-                    "nrl_recent": hasattr(self, "nrl_recent"),
-                    "nrl_upcoming": hasattr(self, "nrl_upcoming"),
-                    "wnba_live": hasattr(self, "wnba_live"),
-                    "wnba_recent": hasattr(self, "wnba_recent"),
-                    "wnba_upcoming": hasattr(self, "wnba_upcoming"),
-                    "ncaam_live": hasattr(self, "ncaam_live"),
-                    "ncaam_recent": hasattr(self, "ncaam_recent"),
-                    "ncaam_upcoming": hasattr(self, "ncaam_upcoming"),
-                    "ncaaw_live": hasattr(self, "ncaaw_live"),
-                    "ncaaw_recent": hasattr(self, "ncaaw_recent"),
-                    "ncaaw_upcoming": hasattr(self, "ncaaw_upcoming"),
+                    attr: getattr(self, attr) is not None for attr in _MANAGER_ATTRS
                 },
             }
 
@@ -2349,7 +2212,7 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             return info
 
         except Exception as e:
-            self.logger.error(f"Error getting plugin info: {e}")
+            self.logger.error("Error getting plugin info: %s", e)
             return {
                 "plugin_id": self.plugin_id,
                 "name": "Rugby League Scoreboard",
@@ -2367,6 +2230,8 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         self._dynamic_manager_progress.clear()
         self._dynamic_managers_completed.clear()
         self._dynamic_cycle_complete = False
+        self._cycle_duration_cache.clear()
+        self._sticky_logged.clear()
 
     def is_cycle_complete(self) -> bool:
         """Report whether the plugin has shown a full cycle of content."""
@@ -2374,14 +2239,21 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             return True
         # Pass the current active display mode to evaluate completion for the right mode
         self._evaluate_dynamic_cycle_completion(display_mode=self._current_active_display_mode)
-        self.logger.info(f"is_cycle_complete() called: display_mode={self._current_active_display_mode}, returning {self._dynamic_cycle_complete}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "is_cycle_complete() called: display_mode=%s, returning %s",
+                self._current_active_display_mode, self._dynamic_cycle_complete
+            )
         return self._dynamic_cycle_complete
 
     def _dynamic_feature_enabled(self) -> bool:
         """Return True when dynamic duration should be active."""
-        if not self.is_enabled:
+        # Constant-time when no league/mode enables dynamic duration at all
+        if not self._any_dynamic_enabled or not self.is_enabled:
             return False
-        return self.supports_dynamic_duration()
+        return self._dynamic_enabled_flat.get(
+            (self._current_display_league, self._current_display_mode_type), False
+        )
     
     def supports_dynamic_duration(self) -> bool:
         """
@@ -2391,27 +2263,16 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         if not self.is_enabled:
             return False
         
-        # If no current display context, return False (no global fallback)
-        if not self._current_display_league or not self._current_display_mode_type:
-            return False
-        
         league = self._current_display_league
         mode_type = self._current_display_mode_type
         
-        # Check per-league/per-mode setting first (most specific)
-        league_config = self.config.get(league, {})
-        league_dynamic = league_config.get("dynamic_duration", {})
-        league_modes = league_dynamic.get("modes", {})
-        mode_config = league_modes.get(mode_type, {})
-        if "enabled" in mode_config:
-            return bool(mode_config.get("enabled", False))
-        
-        # Check per-league setting
-        if "enabled" in league_dynamic:
-            return bool(league_dynamic.get("enabled", False))
+        # If no current display context, return False (no global fallback)
+        if not league or not mode_type:
+            return False
         
-        # No global fallback - return False
-        return False
+        # Per-league/per-mode > per-league, resolved in _rebuild_config_caches();
+        # no global fallback - return False
+        return self._dynamic_enabled_flat.get((league, mode_type), False)
     
     def get_dynamic_duration_cap(self) -> Optional[float]:
         """
@@ -2421,149 +2282,96 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         if not self.is_enabled:
             return None
         
-        # If no current display context, check global setting
-        if not self._current_display_league or not self._current_display_mode_type:
-            return super().get_dynamic_duration_cap()
-        
         league = self._current_display_league
         mode_type = self._current_display_mode_type
         
-        # Check per-league/per-mode setting first (most specific)
-        league_config = self.config.get(league, {})
-        league_dynamic = league_config.get("dynamic_duration", {})
-        league_modes = league_dynamic.get("modes", {})
-        mode_config = league_modes.get(mode_type, {})
-        if "max_duration_seconds" in mode_config:
-            try:
-                cap = float(mode_config.get("max_duration_seconds"))
-                if cap > 0:
-                    return cap
-            except (TypeError, ValueError):
-                pass
-        
-        # Check per-league setting
-        if "max_duration_seconds" in league_dynamic:
-            try:
-                cap = float(league_dynamic.get("max_duration_seconds"))
-                if cap > 0:
-                    return cap
-            except (TypeError, ValueError):
-                pass
+        # If no current display context, check global setting
+        if not league or not mode_type:
+            return super().get_dynamic_duration_cap()
         
-        # No global fallback - return None
-        return None
+        # Per-league/per-mode > per-league, resolved in _rebuild_config_caches();
+        # no global fallback - return None
+        return self._dynamic_cap_flat.get((league, mode_type))
 
     def _get_manager_for_mode(self, mode_name: str):
         """Resolve manager instance for a given display mode."""
-        if mode_name.startswith("nrl_"):
-            if not self.nrl_enabled:
-                return None
-            suffix = mode_name.split("_", 1)[1]
-            if suffix == "live":
-                return getattr(self, "nrl_live", None)
-            if suffix == "recent":
-                return getattr(self, "nrl_recent", None)
-            if suffix == "upcoming":
-                return getattr(self, "nrl_upcoming", None)
-        elif mode_name.startswith("wnba_"):
-            if not self.wnba_enabled:
-                return None
-            suffix = mode_name.split("_", 1)[1]
-            if suffix == "live":
-                return getattr(self, "wnba_live", None)
-            if suffix == "recent":
-                return getattr(self, "wnba_recent", None)
-            if suffix == "upcoming":
-                return getattr(self, "wnba_upcoming", None)
-        elif mode_name.startswith("ncaam_"):
-            if not self.ncaam_enabled:
-                return None
-            suffix = mode_name.split("_", 1)[1]
-            if suffix == "live":
-                return getattr(self, "ncaam_live", None)
-            if suffix == "recent":
-                return getattr(self, "ncaam_recent", None)
-            if suffix == "upcoming":
-                return getattr(self, "ncaam_upcoming", None)
-        elif mode_name.startswith("ncaaw_"):
-            if not self.ncaaw_enabled:
-                return None
-            suffix = mode_name.split("_", 1)[1]
-            if suffix == "live":
-                return getattr(self, "ncaaw_live", None)
-            if suffix == "recent":
-                return getattr(self, "ncaaw_recent", None)
-            if suffix == "upcoming":
-                return getattr(self, "ncaaw_upcoming", None)
-        return None
+        # Only enabled leagues' granular modes are in the table; anything else is None
+        return self._mode_to_manager.get(mode_name)
 
-    def _get_rankings_cache(self) -> Dict[str, int]:
+    def _get_rankings_cache(self) -> Mapping[str, int]:
         """Get combined team rankings cache from all managers.
         
         Returns:
-            Dictionary mapping team abbreviations to their rankings/positions
+            Read-only view mapping team abbreviations to their rankings/positions
             Format: {'LAL': 1, 'BOS': 2, ...}
-            Empty dict if no rankings available
+            Empty mapping if no rankings available
         """
-        rankings = {}
-        
-        # Try to get rankings from each manager
-        for manager_attr in ['nrl_live', 'nrl_recent', 'nrl_upcoming', 
-                            'wnba_live', 'wnba_recent', 'wnba_upcoming',
-                            'ncaam_live', 'ncaam_recent', 'ncaam_upcoming',
-                            'ncaaw_live', 'ncaaw_recent', 'ncaaw_upcoming']:
-            manager = getattr(self, manager_attr, None)
+        # Chain the managers' own caches instead of copying them into a new dict;
+        # callers only do point lookups. Later managers take precedence, so the
+        # chain is built in reverse attribute order.
+        rankings_maps = []
+        for manager_attr in reversed(_MANAGER_ATTRS):
+            manager = getattr(self, manager_attr)
             if manager:
-                manager_rankings = getattr(manager, '_team_rankings_cache', {})
+                manager_rankings = getattr(manager, '_team_rankings_cache', None)
                 if manager_rankings:
-                    rankings.update(manager_rankings)
+                    rankings_maps.append(manager_rankings)
         
-        return rankings
+        return ChainMap(*rankings_maps)
 
-    def _get_manager_for_league_mode(self, league: str, mode_type: str):
-        """Get manager instance for a league and mode type combination.
-        
-        This is a convenience method that calls _get_league_manager_for_mode()
-        for consistency with football-scoreboard naming.
-        
-        Args:
-            league: 'nrl', 'wnba', 'ncaam', or 'ncaaw'
-            mode_type: 'live', 'recent', or 'upcoming'
-            
-        Returns:
-            Manager instance or None if not available/enabled
-        """
-        return self._get_league_manager_for_mode(league, mode_type)
-
-    def _get_games_from_manager(self, manager, mode_type: str) -> List[Dict]:
+    def _get_games_from_manager(
+        self,
+        manager,
+        mode_type: str,
+        league: Optional[str] = None,
+        state: Optional[str] = None,
+        live_only: bool = False,
+    ) -> List[Dict]:
         """Get games list from a manager based on mode type.
         
         Args:
             manager: Manager instance
             mode_type: 'live', 'recent', or 'upcoming'
+            league: If given, stamped onto each game as game['league']
+            state: If given, used as game['status']['state'] for games without one
+            live_only: With league, only return games that are live and not final
             
         Returns:
             List of game dictionaries
         """
-        if mode_type == 'live':
-            return list(getattr(manager, 'live_games', []) or [])
-        elif mode_type == 'recent':
-            # Try games_list first (used by recent managers), then recent_games
-            games = getattr(manager, 'games_list', None)
-            if games is None:
-                games = getattr(manager, 'recent_games', [])
-            return list(games or [])
-        elif mode_type == 'upcoming':
-            # Try games_list first (used by upcoming managers), then upcoming_games
-            games = getattr(manager, 'games_list', None)
-            if games is None:
-                games = getattr(manager, 'upcoming_games', [])
-            return list(games or [])
-        return []
+        # Try games_list first (used by recent/upcoming managers), then
+        # recent_games / upcoming_games; unknown mode types have no attributes
+        games = None
+        for games_attr in _GAMES_ATTRS.get(mode_type, ()):
+            games = getattr(manager, games_attr, None)
+            if games is not None:
+                break
+        if not games:
+            return []
+        if league is None:
+            return list(games)
+        
+        # Annotate games for scroll mode while copying the list
+        annotated = []
+        for game in games:
+            if live_only and (not game.get('is_live') or game.get('is_final')):
+                continue
+            game['league'] = league
+            # Ensure game has status for type determination (without
+            # allocating a throwaway dict for games that already have one)
+            status = game.get('status')
+            if status is None:
+                status = game['status'] = {}
+            status.setdefault('state', state)
+            annotated.append(game)
+        return annotated
 
     def _has_live_games_for_manager(self, manager) -> bool:
         """Check if a manager has valid live games (for favorite teams if configured).
         
+        The result is cached per manager and reused until the manager's
+        live_games list is replaced or changes length.
+        
         Args:
             manager: Manager instance to check
             
@@ -2577,26 +2385,46 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         if not live_games:
             return False
         
-        # Filter out games that are final or appear over
-        live_games = [g for g in live_games if not g.get('is_final', False)]
-        if hasattr(manager, '_is_game_really_over'):
-            live_games = [g for g in live_games if not manager._is_game_really_over(g)]
-        
-        if not live_games:
-            return False
+        # Compare the list itself (not its id(), which a rebuilt list can reuse)
+        cached = self._live_games_result_cache.get(id(manager))
+        if cached is not None and cached[0] is live_games and cached[1] == len(live_games):
+            return cached[2]
         
-        # If favorite teams are configured, only return True if there are live games for favorite teams
-        favorite_teams = getattr(manager, 'favorite_teams', [])
+        # Single pass with early exit: a game counts if it is not final, involves a
+        # favorite team (when configured) and does not appear to be over
+        is_game_really_over = getattr(manager, '_is_game_really_over', None)
+        favorite_teams = self._get_favorite_team_set(manager)
         if favorite_teams:
-            has_favorite_live = any(
-                game.get('home_abbr') in favorite_teams
-                or game.get('away_abbr') in favorite_teams
-                for game in live_games
+            has_live = any(
+                not g.get('is_final', False)
+                and (g.get('home_abbr') in favorite_teams or g.get('away_abbr') in favorite_teams)
+                and not (is_game_really_over and is_game_really_over(g))
+                for g in live_games
+            )
+        else:
+            # No favorite teams configured, any live game counts
+            has_live = any(
+                not g.get('is_final', False)
+                and not (is_game_really_over and is_game_really_over(g))
+                for g in live_games
             )
-            return has_favorite_live
         
-        # No favorite teams configured, any live game counts
-        return True
+        self._live_games_result_cache[id(manager)] = (live_games, len(live_games), has_live)
+        return has_live
+
+    def _get_favorite_team_set(self, manager) -> frozenset:
+        """Return the manager's favorite teams as a frozenset.
+        
+        The set is rebuilt only when the favorite_teams list is replaced or
+        changes length.
+        """
+        favorite_teams = getattr(manager, 'favorite_teams', None) or ()
+        cached = self._favorite_team_sets.get(id(manager))
+        if cached is not None and cached[0] is favorite_teams and cached[1] == len(favorite_teams):
+            return cached[2]
+        favorite_set = frozenset(favorite_teams)
+        self._favorite_team_sets[id(manager)] = (favorite_teams, len(favorite_teams), favorite_set)
+        return favorite_set
 
     def _filter_managers_by_live_content(self, managers: list, mode_type: str) -> list:
         """Filter managers based on live content when in live mode.
@@ -2648,48 +2476,72 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         if mode_type == 'live':
             # For live mode, update managers first to get current live games
             # This ensures we have fresh data before checking for live content
+            live_managers = []
             for league_id in enabled_leagues:
                 manager = self._get_league_manager_for_mode(league_id, 'live')
                 if manager:
+                    live_managers.append((league_id, manager))
+            
+            if len(live_managers) > 1:
+                # Fetches are network-bound; run them on the live update pool and
+                # wait once, so wall-clock time is the slowest league, not the sum.
+                # Managers already updating (e.g. from update()) keep their current data.
+                futures = {}
+                for league_id, manager in live_managers:
+                    future = self._submit_manager_update(
+                        self._live_update_pool, manager, manager.update
+                    )
+                    if future is None:
+                        self.logger.debug("%s live manager update already running, skipping", league_id)
+                        continue
+                    futures[future] = league_id
+                done, not_done = concurrent.futures.wait(futures, timeout=25.0)
+                for future in done:
+                    error = future.exception()
+                    if error is not None:
+                        self.logger.debug("Error updating %s live manager: %s", futures[future], error)
+                for future in not_done:
+                    self.logger.warning(
+                        "Live manager update %s did not complete within timeout", futures[future]
+                    )
+            else:
+                for league_id, manager in live_managers:
+                    if self._manager_update_pending(manager):
+                        self.logger.debug("%s live manager update already running, skipping", league_id)
+                        continue
                     try:
                         manager.update()
                     except Exception as e:
-                        self.logger.debug(f"Error updating {league_id} live manager: {e}")
+                        self.logger.debug("Error updating %s live manager: %s", league_id, e)
             
             # For live mode, respect live_priority settings
-            # Only include managers with live_priority enabled AND actual live games
-            for league_id in enabled_leagues:
-                league_data = self._league_registry.get(league_id, {})
-                live_priority = league_data.get('live_priority', False)
-                
-                manager = self._get_league_manager_for_mode(league_id, 'live')
-                if not manager:
-                    continue
-                
+            # Only include managers with live_priority enabled AND actual live games.
+            # All enabled live managers are collected in the same pass as the fallback.
+            for league_id, manager in live_managers:
                 # If live_priority is enabled, only include if manager has live games
-                if live_priority:
+                if self._league_registry[league_id].get('live_priority', False):
                     if self._has_live_games_for_manager(manager):
                         managers_to_try.append(manager)
                         self.logger.debug(
-                            f"{league_id} has live games and live_priority - adding to list"
+                            "%s has live games and live_priority - adding to list",
+                            league_id
                         )
                 else:
                     # No live_priority - include manager anyway (fallback)
                     managers_to_try.append(manager)
                     self.logger.debug(
-                        f"{league_id} live manager added (no live_priority requirement)"
+                        "%s live manager added (no live_priority requirement)",
+                        league_id
                     )
             
             # If no managers found with live_priority, fall back to all enabled managers
             # This ensures we always have something to show if leagues are enabled
-            if not managers_to_try:
-                for league_id in enabled_leagues:
-                    manager = self._get_league_manager_for_mode(league_id, 'live')
-                    if manager:
-                        managers_to_try.append(manager)
-                        self.logger.debug(
-                            f"Fallback: added {league_id} live manager (no live_priority managers found)"
-                        )
+            if not managers_to_try and live_managers:
+                managers_to_try = [manager for _, manager in live_managers]
+                self.logger.debug(
+                    "Fallback: added %s live manager(s) (no live_priority managers found)",
+                    [league_id for league_id, _ in live_managers]
+                )
         else:
             # For recent and upcoming modes, use standard priority order
             # Get managers for each enabled league in priority order
@@ -2698,14 +2550,15 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
                 if manager:
                     managers_to_try.append(manager)
                     self.logger.debug(
-                        f"Added {league_id} {mode_type} manager to list "
-                        f"(priority: {self._league_registry[league_id].get('priority', 999)})"
+                        "Added %s %s manager to list (priority: %s)",
+                        league_id, mode_type, self._league_registry[league_id].get('priority', 999)
                     )
         
-        self.logger.debug(
-            f"Resolved {len(managers_to_try)} manager(s) for {mode_type} mode: "
-            f"{[m.__class__.__name__ for m in managers_to_try]}"
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Resolved %s manager(s) for %s mode: %s",
+                len(managers_to_try), mode_type, [m.__class__.__name__ for m in managers_to_try]
+            )
         
         return managers_to_try
 
@@ -2733,24 +2586,12 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         self._dynamic_mode_to_manager_key[current_mode] = manager_key
         
         # Extract league and mode_type from current_mode for duration lookups
-        league = None
-        mode_type = None
-        if current_mode:
-            if current_mode.startswith('nrl_'):
-                league = 'nrl'
-                mode_type = current_mode.split('_', 1)[1]
-            elif current_mode.startswith('wnba_'):
-                league = 'wnba'
-                mode_type = current_mode.split('_', 1)[1]
-            elif current_mode.startswith('ncaam_'):
-                league = 'ncaam'
-                mode_type = current_mode.split('_', 1)[1]
-            elif current_mode.startswith('ncaaw_'):
-                league = 'ncaaw'
-                mode_type = current_mode.split('_', 1)[1]
+        league, mode_type = self._parse_mode(current_mode) if current_mode else (None, None)
         
         # Log for debugging
-        self.logger.debug(f"_record_dynamic_progress: current_mode={current_mode}, display_mode={display_mode}, manager={current_manager.__class__.__name__}, manager_key={manager_key}, _last_display_mode={self._last_display_mode}")
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            self.logger.debug("_record_dynamic_progress: current_mode=%s, display_mode=%s, manager=%s, manager_key=%s, _last_display_mode=%s", current_mode, display_mode, current_manager.__class__.__name__, manager_key, self._last_display_mode)
 
         total_games = self._get_total_games_for_manager(current_manager)
         
@@ -2777,16 +2618,16 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
                 # Only treat as new cycle if we've been away for a while OR this is the first time
                 if time_since_last >= NEW_CYCLE_THRESHOLD:
                     is_new_cycle = True
-                    self.logger.info(f"New cycle detected for {display_mode}: switched from {self._last_display_mode} (last seen {time_since_last:.1f}s ago)")
+                    self.logger.info("New cycle detected for %s: switched from %s (last seen %.1fs ago)", display_mode, self._last_display_mode, time_since_last)
                 else:
                     # Quick mode switch within same overall cycle - don't reset
-                    self.logger.debug(f"Quick mode switch to {display_mode} from {self._last_display_mode} ({time_since_last:.1f}s ago) - continuing cycle")
-            elif manager_key not in self._display_mode_to_managers.get(display_mode, set()):
+                    self.logger.debug("Quick mode switch to %s from %s (%.1fs ago) - continuing cycle", display_mode, self._last_display_mode, time_since_last)
+            elif manager_key not in self._display_mode_to_managers.get(display_mode, ()):
                 # Same external mode but manager not tracked yet - could be multi-league setup
-                self.logger.debug(f"Manager {manager_key} not yet tracked for current mode {display_mode}")
+                self.logger.debug("Manager %s not yet tracked for current mode %s", manager_key, display_mode)
             else:
                 # Same mode and manager already tracked - continue within current cycle
-                self.logger.debug(f"Continuing cycle for {display_mode}: manager {manager_key} already tracked")
+                self.logger.debug("Continuing cycle for %s: manager %s already tracked", display_mode, manager_key)
             
             # Update last display mode tracking (only for external calls)
             self._last_display_mode = display_mode
@@ -2797,25 +2638,25 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
                 # New cycle starting - reset ALL state for this manager to start completely fresh
                 if manager_key in self._single_game_manager_start_times:
                     old_start = self._single_game_manager_start_times[manager_key]
-                    self.logger.info(f"New cycle for {display_mode}: resetting start time for {manager_key} (old: {old_start:.2f})")
+                    self.logger.info("New cycle for %s: resetting start time for %s (old: %.2f)", display_mode, manager_key, old_start)
                     del self._single_game_manager_start_times[manager_key]
                 # Also remove from completed set so it can be tracked fresh in this cycle
                 if manager_key in self._dynamic_managers_completed:
-                    self.logger.info(f"New cycle for {display_mode}: removing {manager_key} from completed set")
+                    self.logger.info("New cycle for %s: removing %s from completed set", display_mode, manager_key)
                     self._dynamic_managers_completed.discard(manager_key)
                 # Also clear any game ID start times for this manager
                 if manager_key in self._game_id_start_times:
-                    self.logger.info(f"New cycle for {display_mode}: clearing game ID start times for {manager_key}")
+                    self.logger.info("New cycle for %s: clearing game ID start times for %s", display_mode, manager_key)
                     del self._game_id_start_times[manager_key]
                 # Clear progress tracking for this manager
                 if manager_key in self._dynamic_manager_progress:
-                    self.logger.info(f"New cycle for {display_mode}: clearing progress for {manager_key}")
+                    self.logger.info("New cycle for %s: clearing progress for %s", display_mode, manager_key)
                     self._dynamic_manager_progress[manager_key].clear()
         
         # Now add to tracking AFTER checking for new cycle
         if display_mode and display_mode != current_mode:
             # Store mapping from display_mode to manager_key for completion checking
-            self._display_mode_to_managers.setdefault(display_mode, set()).add(manager_key)
+            self._display_mode_to_managers[display_mode].add(manager_key)
         
         if total_games <= 1:
             # Single (or no) game - wait for full game display duration before marking complete
@@ -2826,7 +2667,7 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         current_game = getattr(current_manager, "current_game", None)
         if not current_game:
             # No current game - can't track progress, but this is valid (empty game list)
-            self.logger.debug(f"No current_game in manager {manager_key}, skipping progress tracking")
+            self.logger.debug("No current_game in manager %s, skipping progress tracking", manager_key)
             # Still mark the mode as seen even if no content
             return
         
@@ -2842,47 +2683,52 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
                 game_id = f"{away_abbr}@{home_abbr}-{current_index}"
             else:
                 game_id = f"index-{current_index}"
-            self.logger.warning(f"Game ID not found for manager {manager_key}, using fallback: {game_id}")
+            self.logger.warning("Game ID not found for manager %s, using fallback: %s", manager_key, game_id)
         
-        # Ensure game_id is a string for consistent tracking
-        game_id = str(game_id)
+        # Ensure game_id is a string for consistent tracking (IDs parsed from
+        # JSON usually already are)
+        if not isinstance(game_id, str):
+            game_id = str(game_id)
         
         progress_set = self._dynamic_manager_progress.setdefault(manager_key, set())
         
         # Track when this game ID was first seen
         game_times = self._game_id_start_times.setdefault(manager_key, {})
+        game_duration = self._get_game_duration(league, mode_type, current_manager) if league and mode_type else getattr(current_manager, 'game_display_duration', 15)
         if game_id not in game_times:
-            # First time seeing this game - record start time
-            game_times[game_id] = time.time()
-            game_duration = self._get_game_duration(league, mode_type, current_manager) if league and mode_type else getattr(current_manager, 'game_display_duration', 15)
+            # First time seeing this game - record start time under an interned key,
+            # so later progress_set/game_times lookups can match by identity
+            game_id = sys.intern(game_id)
+            game_times[game_id] = current_time
             game_display = f"{current_game.get('away_abbr', '?')}@{current_game.get('home_abbr', '?')}"
-            self.logger.info(f"Game {game_display} (ID: {game_id}) in manager {manager_key} first seen, will complete after {game_duration}s")
+            self.logger.info("Game %s (ID: %s) in manager %s first seen, will complete after %ss", game_display, game_id, manager_key, game_duration)
         
         # Check if this game has been shown for full duration
         start_time = game_times[game_id]
-        game_duration = self._get_game_duration(league, mode_type, current_manager) if league and mode_type else getattr(current_manager, 'game_display_duration', 15)
-        elapsed = time.time() - start_time
+        elapsed = current_time - start_time
         
         if elapsed >= game_duration:
             # This game has been shown for full duration - add to progress set
             if game_id not in progress_set:
                 progress_set.add(game_id)
                 game_display = f"{current_game.get('away_abbr', '?')}@{current_game.get('home_abbr', '?')}"
-                self.logger.info(f"Game {game_display} (ID: {game_id}) in manager {manager_key} completed after {elapsed:.2f}s (required: {game_duration}s)")
+                self.logger.info("Game %s (ID: %s) in manager %s completed after %.2fs (required: %ss)", game_display, game_id, manager_key, elapsed, game_duration)
         else:
             # Still waiting for this game to complete its duration
-            self.logger.debug(f"Game ID {game_id} in manager {manager_key} waiting: {elapsed:.2f}s/{game_duration}s")
+            self.logger.debug("Game ID %s in manager %s waiting: %.2fs/%ss", game_id, manager_key, elapsed, game_duration)
 
         # Get all valid game IDs from current game list to clean up stale entries
         valid_game_ids = self._get_all_game_ids_for_manager(current_manager)
         
         # Clean up progress set and start times for games that no longer exist
+        # (in place, and only when something is actually stale)
         if valid_game_ids:
             # Remove game IDs from progress set that are no longer in the game list
-            progress_set.intersection_update(valid_game_ids)
+            if not progress_set <= valid_game_ids:
+                progress_set.intersection_update(valid_game_ids)
             # Also clean up start times for games that no longer exist
-            game_times = {k: v for k, v in game_times.items() if k in valid_game_ids}
-            self._game_id_start_times[manager_key] = game_times
+            for stale_game_id in game_times.keys() - valid_game_ids:
+                del game_times[stale_game_id]
         elif total_games == 0:
             # No games in list - clear all tracking for this manager
             progress_set.clear()
@@ -2891,22 +2737,23 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
 
         # Only mark manager complete when all current games have been shown for their full duration
         # Use the actual current game IDs, not just the count, to handle dynamic game lists
-        current_game_ids = self._get_all_game_ids_for_manager(current_manager)
+        # (the same set computed above for cleanup)
+        current_game_ids = valid_game_ids
         
         if current_game_ids:
             # Check if all current games have been shown for full duration
             if current_game_ids.issubset(progress_set):
                 if manager_key not in self._dynamic_managers_completed:
                     self._dynamic_managers_completed.add(manager_key)
-                    self.logger.info(f"Manager {manager_key} completed - all {len(current_game_ids)} games shown for full duration (progress: {len(progress_set)} game IDs)")
-            else:
+                    self.logger.info("Manager %s completed - all %s games shown for full duration (progress: %s game IDs)", manager_key, len(current_game_ids), len(progress_set))
+            elif debug_enabled:
                 missing_count = len(current_game_ids - progress_set)
-                self.logger.debug(f"Manager {manager_key} incomplete - {missing_count} of {len(current_game_ids)} games not yet shown for full duration")
+                self.logger.debug("Manager %s incomplete - %s of %s games not yet shown for full duration", manager_key, missing_count, len(current_game_ids))
         elif total_games == 0:
             # Empty game list - mark as complete immediately
             if manager_key not in self._dynamic_managers_completed:
                 self._dynamic_managers_completed.add(manager_key)
-                self.logger.debug(f"Manager {manager_key} completed - no games to display")
+                self.logger.debug("Manager %s completed - no games to display", manager_key)
 
     def _evaluate_dynamic_cycle_completion(self, display_mode: str = None) -> None:
         """
@@ -2931,6 +2778,11 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         if not self.modes:
             self._dynamic_cycle_complete = True
             return
+        
+        # One reference instant for every elapsed-time comparison below
+        current_time = time.time()
+        completed = self._dynamic_managers_completed
+        start_times = self._single_game_manager_start_times
 
         # If display_mode is provided, check all managers used for that display mode
         # This handles multi-league scenarios where we need all leagues to complete
@@ -2939,68 +2791,62 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             if not used_manager_keys:
                 # No managers were used for this display mode yet - cycle not complete
                 self._dynamic_cycle_complete = False
-                self.logger.debug(f"Display mode {display_mode} has no managers tracked yet - cycle incomplete")
+                self.logger.debug("Display mode %s has no managers tracked yet - cycle incomplete", display_mode)
                 return
             
-            # Extract mode type to get enabled leagues for comparison
-            mode_type = self._extract_mode_type(display_mode)
-            enabled_leagues = self._get_enabled_leagues_for_mode(mode_type) if mode_type else []
-            
-            self.logger.info(
-                f"_evaluate_dynamic_cycle_completion for {display_mode}: "
-                f"checking {len(used_manager_keys)} manager(s): {used_manager_keys}, "
-                f"enabled leagues: {enabled_leagues}"
-            )
+            # Enabled leagues are only reported for comparison, so skip the
+            # lookup unless the INFO log will actually be emitted
+            if self.logger.isEnabledFor(logging.INFO):
+                mode_type = self._extract_mode_type(display_mode)
+                enabled_leagues = self._get_enabled_leagues_for_mode(mode_type) if mode_type else ()
+                self.logger.info(
+                    "_evaluate_dynamic_cycle_completion for %s: checking %s manager(s): %s, "
+                    "enabled leagues: %s",
+                    display_mode, len(used_manager_keys), used_manager_keys, enabled_leagues
+                )
             
             # Check if all managers used for this display mode have completed
-            incomplete_managers = []
-            for manager_key in used_manager_keys:
-                if manager_key not in self._dynamic_managers_completed:
-                    incomplete_managers.append(manager_key)
-                    # Get the manager to check its state for logging and potential completion
-                    # Extract mode and manager class from manager_key (format: "mode:ManagerClass")
-                    parts = manager_key.split(':', 1)
-                    if len(parts) == 2:
-                        mode_name, manager_class_name = parts
-                        manager = self._get_manager_for_mode(mode_name)
-                        if manager and manager.__class__.__name__ == manager_class_name:
-                            total_games = self._get_total_games_for_manager(manager)
-                            if total_games <= 1:
-                                # Single-game manager - check time
-                                if manager_key in self._single_game_manager_start_times:
-                                    start_time = self._single_game_manager_start_times[manager_key]
-                                    # Extract league and mode_type from mode_name
-                                    league = None
-                                    if mode_name.startswith('nrl_'):
-                                        league = 'nrl'
-                                    elif mode_name.startswith('wnba_'):
-                                        league = 'wnba'
-                                    elif mode_name.startswith('ncaam_'):
-                                        league = 'ncaam'
-                                    elif mode_name.startswith('ncaaw_'):
-                                        league = 'ncaaw'
-                                    mode_type_str = mode_name.split('_')[-1] if mode_name else None
-                                    game_duration = self._get_game_duration(league, mode_type_str, manager) if league and mode_type_str else getattr(manager, 'game_display_duration', 15)
-                                    current_time = time.time()
-                                    elapsed = current_time - start_time
-                                    if elapsed >= game_duration:
-                                        self._dynamic_managers_completed.add(manager_key)
-                                        incomplete_managers.remove(manager_key)
-                                        self.logger.info(f"Manager {manager_key} marked complete in completion check: {elapsed:.2f}s >= {game_duration}s")
-                                        # Clean up start time now that manager has completed
-                                        if manager_key in self._single_game_manager_start_times:
-                                            del self._single_game_manager_start_times[manager_key]
-                                    else:
-                                        self.logger.debug(f"Manager {manager_key} waiting in completion check: {elapsed:.2f}s/{game_duration}s (start_time={start_time:.2f}, current_time={current_time:.2f})")
-                                else:
-                                    # Manager not yet seen - keep it incomplete
-                                    # This means _record_dynamic_progress hasn't been called yet for this manager
-                                    # or the state was reset, so we can't determine completion
-                                    self.logger.debug(f"Manager {manager_key} not yet seen in completion check (not in start_times) - keeping incomplete")
+            incomplete_managers = [key for key in used_manager_keys if key not in completed]
+            # Only single-game managers with a recorded start time can be completed
+            # by the time check below; without any, the cycle is simply incomplete
+            pending_single_game = [key for key in incomplete_managers if key in start_times]
+            if incomplete_managers and not pending_single_game:
+                self._dynamic_cycle_complete = False
+                self.logger.debug(
+                    "Display mode %s cycle incomplete - %s manager(s) still in progress "
+                    "(none awaiting a single-game time check): %s",
+                    display_mode, len(incomplete_managers), incomplete_managers
+                )
+                return
+            
+            for manager_key in pending_single_game:
+                # Get the manager to check its state for logging and potential completion
+                # Extract mode and manager class from manager_key (format: "mode:ManagerClass")
+                parts = manager_key.split(':', 1)
+                if len(parts) == 2:
+                    mode_name, manager_class_name = parts
+                    manager = self._get_manager_for_mode(mode_name)
+                    if manager and manager.__class__.__name__ == manager_class_name:
+                        total_games = self._get_total_games_for_manager(manager)
+                        if total_games <= 1:
+                            # Single-game manager - check time
+                            start_time = start_times[manager_key]
+                            # Extract league and mode_type from mode_name
+                            league, mode_type_str = self._parse_mode(mode_name)
+                            game_duration = self._get_game_duration(league, mode_type_str, manager) if league and mode_type_str else getattr(manager, 'game_display_duration', 15)
+                            elapsed = current_time - start_time
+                            if elapsed >= game_duration:
+                                completed.add(manager_key)
+                                incomplete_managers.remove(manager_key)
+                                self.logger.info("Manager %s marked complete in completion check: %.2fs >= %ss", manager_key, elapsed, game_duration)
+                                # Clean up start time now that manager has completed
+                                start_times.pop(manager_key, None)
+                            else:
+                                self.logger.debug("Manager %s waiting in completion check: %.2fs/%ss (start_time=%.2f, current_time=%.2f)", manager_key, elapsed, game_duration, start_time, current_time)
             
             if incomplete_managers:
                 self._dynamic_cycle_complete = False
-                self.logger.debug(f"Display mode {display_mode} cycle incomplete - {len(incomplete_managers)} manager(s) still in progress: {incomplete_managers}")
+                self.logger.debug("Display mode %s cycle incomplete - %s manager(s) still in progress: %s", display_mode, len(incomplete_managers), incomplete_managers)
                 return
             
             # All managers completed - verify they truly completed
@@ -3008,40 +2854,31 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             all_truly_completed = True
             for manager_key in used_manager_keys:
                 # If manager has a start time, it hasn't completed yet (or just completed)
-                if manager_key in self._single_game_manager_start_times:
+                if manager_key in start_times:
                     # Still has start time - check if it should be completed
                     parts = manager_key.split(':', 1)
                     if len(parts) == 2:
                         mode_name, manager_class_name = parts
                         manager = self._get_manager_for_mode(mode_name)
                         if manager and manager.__class__.__name__ == manager_class_name:
-                            start_time = self._single_game_manager_start_times[manager_key]
+                            start_time = start_times[manager_key]
                             # Extract league and mode_type from mode_name
-                            league = None
-                            if mode_name.startswith('nrl_'):
-                                league = 'nrl'
-                            elif mode_name.startswith('wnba_'):
-                                league = 'wnba'
-                            elif mode_name.startswith('ncaam_'):
-                                league = 'ncaam'
-                            elif mode_name.startswith('ncaaw_'):
-                                league = 'ncaaw'
-                            mode_type_str = mode_name.split('_')[-1] if mode_name else None
+                            league, mode_type_str = self._parse_mode(mode_name)
                             game_duration = self._get_game_duration(league, mode_type_str, manager) if league and mode_type_str else getattr(manager, 'game_display_duration', 15)
-                            elapsed = time.time() - start_time
+                            elapsed = current_time - start_time
                             if elapsed < game_duration:
                                 # Not enough time has passed - not truly completed
                                 all_truly_completed = False
-                                self.logger.debug(f"Manager {manager_key} in completed set but still has start time with {elapsed:.2f}s < {game_duration}s")
+                                self.logger.debug("Manager %s in completed set but still has start time with %.2fs < %ss", manager_key, elapsed, game_duration)
                                 break
             
             if all_truly_completed:
                 self._dynamic_cycle_complete = True
-                self.logger.info(f"Display mode {display_mode} cycle complete - all {len(used_manager_keys)} manager(s) completed")
+                self.logger.info("Display mode %s cycle complete - all %s manager(s) completed", display_mode, len(used_manager_keys))
             else:
                 # Some managers aren't truly completed - keep cycle incomplete
                 self._dynamic_cycle_complete = False
-                self.logger.debug(f"Display mode {display_mode} cycle incomplete - some managers not truly completed yet")
+                self.logger.debug("Display mode %s cycle incomplete - some managers not truly completed yet", display_mode)
             return
 
         # Standard mode checking (for internal mode cycling)
@@ -3050,27 +2887,26 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             self._dynamic_cycle_complete = True
             return
 
+        # _record_dynamic_progress() adds a mode to _dynamic_cycle_seen_modes whenever it
+        # maps it to a manager key, so a single lookup covers both "seen" and "tracked"
+        mode_to_manager_key = self._dynamic_mode_to_manager_key
         for mode_name in required_modes:
-            if mode_name not in self._dynamic_cycle_seen_modes:
-                self._dynamic_cycle_complete = False
-                return
-
-            manager_key = self._dynamic_mode_to_manager_key.get(mode_name)
+            manager_key = mode_to_manager_key.get(mode_name)
             if not manager_key:
                 self._dynamic_cycle_complete = False
                 return
 
-            if manager_key not in self._dynamic_managers_completed:
+            if manager_key not in completed:
                 manager = self._get_manager_for_mode(mode_name)
                 total_games = self._get_total_games_for_manager(manager)
                 if total_games <= 1:
                     # For single-game managers, check if enough time has passed
-                    if manager_key in self._single_game_manager_start_times:
-                        start_time = self._single_game_manager_start_times[manager_key]
+                    if manager_key in start_times:
+                        start_time = start_times[manager_key]
                         game_duration = getattr(manager, 'game_display_duration', 15) if manager else 15
-                        elapsed = time.time() - start_time
+                        elapsed = current_time - start_time
                         if elapsed >= game_duration:
-                            self._dynamic_managers_completed.add(manager_key)
+                            completed.add(manager_key)
                         else:
                             # Not enough time yet
                             self._dynamic_cycle_complete = False
@@ -3086,11 +2922,12 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
                     
                     # Check if all current games are in the progress set (shown for full duration)
                     if current_game_ids and current_game_ids.issubset(progress_set):
-                        self._dynamic_managers_completed.add(manager_key)
+                        completed.add(manager_key)
                         # Continue to check other modes
                     else:
-                        missing_games = current_game_ids - progress_set if current_game_ids else set()
-                        self.logger.debug(f"Manager {manager_key} progress: {len(progress_set)}/{len(current_game_ids)} games completed, missing: {len(missing_games)}")
+                        if self.logger.isEnabledFor(logging.DEBUG):
+                            missing_games = current_game_ids - progress_set
+                            self.logger.debug("Manager %s progress: %s/%s games completed, missing: %s", manager_key, len(progress_set), len(current_game_ids), len(missing_games))
                         self._dynamic_cycle_complete = False
                         return
 
@@ -3098,18 +2935,71 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
 
     @staticmethod
     def _build_manager_key(mode_name: str, manager) -> str:
-        manager_name = manager.__class__.__name__ if manager else "None"
-        return f"{mode_name}:{manager_name}"
+        # Keys are built on every successful display tick; reuse the formatted
+        # string (format "mode:ManagerClass" is parsed back in
+        # _evaluate_dynamic_cycle_completion)
+        cache_key = (mode_name, manager.__class__ if manager else type(None))
+        key = _MANAGER_KEY_CACHE.get(cache_key)
+        if key is None:
+            manager_name = manager.__class__.__name__ if manager else "None"
+            key = _MANAGER_KEY_CACHE[cache_key] = f"{mode_name}:{manager_name}"
+        return key
 
     @staticmethod
-    def _get_total_games_for_manager(manager) -> int:
-        if manager is None:
-            return 0
-        for attr in ("live_games", "games_list", "recent_games", "upcoming_games"):
+    def _get_game_list_for_manager(manager) -> Optional[List[Dict]]:
+        """Return the list of games a manager is displaying, or None.
+        
+        Sports managers name the attribute through their GAMES_ATTR class
+        attribute; anything else is probed in _PROBED_GAMES_ATTRS order.
+        """
+        games_attr = getattr(manager, 'GAMES_ATTR', None)
+        if games_attr is not None:
+            games = getattr(manager, games_attr, None)
+            return games if isinstance(games, list) else None
+        for attr in _PROBED_GAMES_ATTRS:
             value = getattr(manager, attr, None)
             if isinstance(value, list):
-                return len(value)
-        return 0
+                return value
+        return None
+
+    @staticmethod
+    def _get_total_games_for_manager(manager) -> int:
+        games = RugbyLeagueScoreboardPlugin._get_game_list_for_manager(manager)
+        return len(games) if games is not None else 0
+
+    def _get_all_game_ids_for_manager(self, manager) -> frozenset:
+        """Return the IDs of every game in the manager's current game list.
+        
+        Games without an 'id' get the same fallback IDs _record_dynamic_progress
+        uses. The set is cached per manager and rebuilt only when the game
+        list is replaced or changes length.
+        """
+        games = self._get_game_list_for_manager(manager)
+        if not games:
+            return frozenset()
+        
+        # Compare the list itself (not its id(), which a rebuilt list can reuse)
+        cached = self._manager_game_ids_cache.get(id(manager))
+        if cached is not None and cached[0] is games and cached[1] == len(games):
+            return cached[2]
+        
+        game_ids = set()
+        for index, game in enumerate(games):
+            game_id = game.get('id')
+            if not game_id:
+                away_abbr = game.get('away_abbr', '')
+                home_abbr = game.get('home_abbr', '')
+                if away_abbr and home_abbr:
+                    game_id = f"{away_abbr}@{home_abbr}-{index}"
+                else:
+                    game_id = f"index-{index}"
+            elif not isinstance(game_id, str):
+                game_id = str(game_id)
+            game_ids.add(sys.intern(game_id))
+        
+        game_ids = frozenset(game_ids)
+        self._manager_game_ids_cache[id(manager)] = (games, len(games), game_ids)
+        return game_ids
 
     # -------------------------------------------------------------------------
     # Scroll mode helper methods
@@ -3118,7 +3008,7 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         self,
         mode_type: str = None,
         live_priority_active: bool = False
-    ) -> Tuple[List[Dict], List[str]]:
+    ) -> Tuple[List[Dict], List[str], Dict[str, int]]:
         """
         Collect all games from enabled leagues for scroll mode.
 
@@ -3128,10 +3018,12 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             live_priority_active: If True, only include live games
 
         Returns:
-            Tuple of (games list with league info, list of leagues included)
+            Tuple of (games list with league info, list of leagues included,
+            {game type: number of games collected})
         """
         games = []
         leagues = []
+        game_type_counts = {'live': 0, 'recent': 0, 'upcoming': 0}
 
         # Determine which mode types to collect
         if mode_type is None:
@@ -3140,110 +3032,44 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         else:
             # Collect single game type for internal plugin scroll mode
             mode_types = [mode_type]
-
-        # Collect NRL games if enabled
-        if self.nrl_enabled:
-            league_games = []
-            for mt in mode_types:
-                manager = self._get_manager_for_league_mode('nrl', mt)
-                if manager:
-                    nrl_games = self._get_games_from_manager(manager, mt)
-                    if nrl_games:
-                        # Add league info and ensure status field
-                        for game in nrl_games:
-                            game['league'] = 'nrl'
-                            # Ensure game has status for type determination
-                            if 'status' not in game:
-                                game['status'] = {}
-                            if 'state' not in game['status']:
-                                # Infer state from mode_type
-                                state_map = {'live': 'in', 'recent': 'post', 'upcoming': 'pre'}
-                                game['status']['state'] = state_map.get(mt, 'pre')
-                        league_games.extend(nrl_games)
-                        self.logger.debug(f"Collected {len(nrl_games)} NRL {mt} games for scroll")
-
-            if league_games:
-                games.extend(league_games)
-                leagues.append('nrl')
-
-        # Collect WNBA games if enabled
-        if self.wnba_enabled:
-            league_games = []
-            for mt in mode_types:
-                manager = self._get_manager_for_league_mode('wnba', mt)
-                if manager:
-                    wnba_games = self._get_games_from_manager(manager, mt)
-                    if wnba_games:
-                        # Add league info and ensure status field
-                        for game in wnba_games:
-                            game['league'] = 'wnba'
-                            # Ensure game has status for type determination
-                            if 'status' not in game:
-                                game['status'] = {}
-                            if 'state' not in game['status']:
-                                state_map = {'live': 'in', 'recent': 'post', 'upcoming': 'pre'}
-                                game['status']['state'] = state_map.get(mt, 'pre')
-                        league_games.extend(wnba_games)
-                        self.logger.debug(f"Collected {len(wnba_games)} WNBA {mt} games for scroll")
-
-            if league_games:
-                games.extend(league_games)
-                leagues.append('wnba')
-
-        # Collect NCAA Men's games if enabled
-        if self.ncaam_enabled:
-            league_games = []
-            for mt in mode_types:
-                manager = self._get_manager_for_league_mode('ncaam', mt)
-                if manager:
-                    ncaam_games = self._get_games_from_manager(manager, mt)
-                    if ncaam_games:
-                        # Add league info and ensure status field
-                        for game in ncaam_games:
-                            game['league'] = 'ncaam'
-                            # Ensure game has status for type determination
-                            if 'status' not in game:
-                                game['status'] = {}
-                            if 'state' not in game['status']:
-                                state_map = {'live': 'in', 'recent': 'post', 'upcoming': 'pre'}
-                                game['status']['state'] = state_map.get(mt, 'pre')
-                        league_games.extend(ncaam_games)
-                        self.logger.debug(f"Collected {len(ncaam_games)} NCAA Men's {mt} games for scroll")
-
-            if league_games:
-                games.extend(league_games)
-                leagues.append('ncaam')
-
-        # Collect NCAA Women's games if enabled
-        if self.ncaaw_enabled:
+        if live_priority_active:
+            # Only live games are kept under live priority, so don't collect
+            # recent/upcoming games just to drop them
+            mode_types = [mt for mt in mode_types if mt == 'live']
+
+        # Per requested mode type: its position in the per-league manager tuples
+        # and the state inferred for its games that carry none
+        mode_specs = [
+            (mt, _MODE_TYPE_ORDER.index(mt), _SCROLL_STATE_MAP.get(mt, 'pre'))
+            for mt in mode_types if mt in _MODE_TYPES
+        ]
+
+        # Collect games for each enabled league, in league priority order
+        # (_league_managers holds only enabled leagues' (live, recent, upcoming) managers)
+        for league, league_managers in self._league_managers.items():
             league_games = []
-            for mt in mode_types:
-                manager = self._get_manager_for_league_mode('ncaaw', mt)
+            for mt, mode_index, state in mode_specs:
+                manager = league_managers[mode_index]
                 if manager:
-                    ncaaw_games = self._get_games_from_manager(manager, mt)
-                    if ncaaw_games:
-                        # Add league info and ensure status field
-                        for game in ncaaw_games:
-                            game['league'] = 'ncaaw'
-                            # Ensure game has status for type determination
-                            if 'status' not in game:
-                                game['status'] = {}
-                            if 'state' not in game['status']:
-                                state_map = {'live': 'in', 'recent': 'post', 'upcoming': 'pre'}
-                                game['status']['state'] = state_map.get(mt, 'pre')
-                        league_games.extend(ncaaw_games)
-                        self.logger.debug(f"Collected {len(ncaaw_games)} NCAA Women's {mt} games for scroll")
+                    # Games come back with league info and a status state
+                    # (inferred from mode_type where missing), filtered to
+                    # live, non-final games under live priority
+                    mode_games = self._get_games_from_manager(
+                        manager, mt, league, state, live_priority_active
+                    )
+                    if mode_games:
+                        league_games.extend(mode_games)
+                        game_type_counts[mt] += len(mode_games)
+                        self.logger.debug("Collected %s %s %s games for scroll", len(mode_games), _LEAGUE_DISPLAY_NAMES[league], mt)
 
             if league_games:
                 games.extend(league_games)
-                leagues.append('ncaaw')
+                leagues.append(league)
 
-        # If live priority is active, filter to only live games
         if live_priority_active:
-            games = [g for g in games if g.get('is_live', False) and not g.get('is_final', False)]
-            self.logger.debug(f"Live priority active: filtered to {len(games)} live games")
+            self.logger.debug("Live priority active: filtered to %s live games", len(games))
 
-        return games, leagues
+        return games, leagues, game_type_counts
 
     # -------------------------------------------------------------------------
     # Vegas scroll mode support
@@ -3258,7 +3084,7 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         Returns:
             List of PIL Images from scroll displays, or None if no content
         """
-        if not hasattr(self, '_scroll_manager') or not self._scroll_manager:
+        if self._scroll_manager is None:
             return None
 
         images = self._scroll_manager.get_all_vegas_content_items()
@@ -3269,11 +3095,12 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             images = self._scroll_manager.get_all_vegas_content_items()
 
         if images:
-            total_width = sum(img.width for img in images)
-            self.logger.info(
-                "[Rugby League Vegas] Returning %d image(s), %dpx total",
-                len(images), total_width
-            )
+            # The total width is only reported, so skip summing it unless logged
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "[Rugby League Vegas] Returning %d image(s), %dpx total",
+                    len(images), sum(img.width for img in images)
+                )
             return images
 
         return None
@@ -3295,16 +3122,23 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
             VegasDisplayMode.SCROLL - Content scrolls continuously
         """
         if VegasDisplayMode:
-            # Check for config override
+            # Check for config override; the resolved mode is reused until the
+            # configured value changes
             config_mode = self.config.get("vegas_mode")
+            cached = self._vegas_mode_cache
+            if cached is not None and cached[0] == config_mode:
+                return cached[1]
+            vegas_mode = VegasDisplayMode.SCROLL
             if config_mode:
                 try:
-                    return VegasDisplayMode(config_mode)
+                    vegas_mode = VegasDisplayMode(config_mode)
                 except ValueError:
                     self.logger.warning(
-                        f"Invalid vegas_mode '{config_mode}' in config, using SCROLL"
+                        "Invalid vegas_mode '%s' in config, using SCROLL",
+                        config_mode
                     )
-            return VegasDisplayMode.SCROLL
+            self._vegas_mode_cache = (config_mode, vegas_mode)
+            return vegas_mode
         # Fallback if VegasDisplayMode not available
         return "scroll"
 
@@ -3315,28 +3149,18 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
         This method is called by get_vegas_content() when the scroll cache is empty.
         It collects all game types (live, recent, upcoming) organized by league.
         """
-        if not hasattr(self, '_scroll_manager') or not self._scroll_manager:
+        if self._scroll_manager is None:
             self.logger.debug("[Rugby League Vegas] No scroll manager available")
             return
 
         # Collect all games (live, recent, upcoming) organized by league
-        games, leagues = self._collect_games_for_scroll(mode_type=None)
+        # (game type counts for logging are tallied during collection)
+        games, leagues, game_type_counts = self._collect_games_for_scroll(mode_type=None)
 
         if not games:
             self.logger.debug("[Rugby League Vegas] No games available")
             return
 
-        # Count games by type for logging
-        game_type_counts = {'live': 0, 'recent': 0, 'upcoming': 0}
-        for game in games:
-            state = game.get('status', {}).get('state', '')
-            if state == 'in':
-                game_type_counts['live'] += 1
-            elif state == 'post':
-                game_type_counts['recent'] += 1
-            elif state == 'pre':
-                game_type_counts['upcoming'] += 1
-
         # Get rankings cache if available
         rankings_cache = self._get_rankings_cache() if hasattr(self, '_get_rankings_cache') else None
 
@@ -3351,8 +3175,8 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
                 f"{count} {gtype}" for gtype, count in game_type_counts.items() if count > 0
             )
             self.logger.info(
-                f"[Rugby League Vegas] Successfully generated scroll content: "
-                f"{len(games)} games ({type_summary}) from {', '.join(leagues)}"
+                "[Rugby League Vegas] Successfully generated scroll content: %s games (%s) from %s",
+                len(games), type_summary, ', '.join(leagues)
             )
         else:
             self.logger.warning("[Rugby League Vegas] Failed to generate scroll content")
@@ -3360,9 +3184,12 @@ class RugbyLeagueScoreboardPlugin(BasePlugin if BasePlugin else object):
     def cleanup(self) -> None:
         """Clean up resources."""
         try:
-            if hasattr(self, "background_service") and self.background_service:
+            if self.background_service is not None:
                 # Clean up background service if needed
                 pass
+            # Stop the update worker pools; don't block on in-flight fetches
+            self._update_pool.shutdown(wait=False)
+            self._live_update_pool.shutdown(wait=False)
             self.logger.info("Rugby League scoreboard plugin cleanup completed")
         except Exception as e:
-            self.logger.error(f"Error during cleanup: {e}")
+            self.logger.error("Error during cleanup: %s", e)
@@ -1,8 +1,10 @@
 import logging
 import os
-from datetime import datetime, timedelta
+import time
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import pytz
 import requests
@@ -16,6 +18,16 @@ ESPN_NRL_SCOREBOARD_URL = (
 )
 
 
+@lru_cache(maxsize=4)
+def _season_metadata(sport_key: str, utc_date: date) -> Tuple[int, str, str]:
+    """Return (season_year, ESPN dates range, cache key) for the given UTC day."""
+    # NRL season typically runs from February to October
+    season_year = utc_date.year
+    datestring = f"{season_year}0201-{season_year}1031"
+    cache_key = f"{sport_key}_schedule_{season_year}"
+    return season_year, datestring, cache_key
+
+
 class BaseNRLManager(RugbyLeague):
     """Base class for NRL managers with common functionality."""
 
@@ -25,6 +37,8 @@ class BaseNRLManager(RugbyLeague):
     _warning_cooldown = 60  # Only log warnings once per minute
     _shared_data = None
     _last_shared_update = 0
+    _shared_cache_key = None  # Season cache key _shared_data was loaded for
+    _shared_data_ttl = 60  # Seconds the shared schedule is reused across managers
 
     def __init__(self, config: Dict[str, Any], display_manager, cache_manager):
         self.logger = logging.getLogger("NRL")
@@ -51,34 +65,51 @@ class BaseNRLManager(RugbyLeague):
         )
         self.league = "3"
 
+    @staticmethod
+    def _set_shared_data(cache_key: str, data: Dict) -> None:
+        """Publish a season schedule to every manager of this league.
+
+        Set on BaseNRLManager itself so Recent and Upcoming subclasses share it.
+        """
+        BaseNRLManager._shared_data = data
+        BaseNRLManager._shared_cache_key = cache_key
+        BaseNRLManager._last_shared_update = time.monotonic()
+
     def _fetch_nrl_api_data(self, use_cache: bool = True) -> Optional[Dict]:
         """
         Fetches the full season schedule for NRL using background threading.
         Returns cached data immediately if available, otherwise starts background fetch.
         """
-        now = datetime.now(pytz.utc)
-        season_year = now.year
-        # NRL season typically runs from February to October
-        #if now.month < 10:
-            #season_year = now.year - 1
-        season_year = now.year
-        datestring = f"{season_year}0201-{season_year}1031"
-        cache_key = f"{self.sport_key}_schedule_{season_year}"
-
-        # Check cache first
+        # Season strings only change with the UTC day, so they are memoized
+        season_year, datestring, cache_key = _season_metadata(
+            self.sport_key, datetime.now(pytz.utc).date()
+        )
+
+        # Check cache first; Recent and Upcoming managers share one recent
+        # copy of the season schedule instead of each hitting the cache manager
         if use_cache:
+            if (
+                BaseNRLManager._shared_cache_key == cache_key
+                and time.monotonic() - BaseNRLManager._last_shared_update
+                < BaseNRLManager._shared_data_ttl
+            ):
+                self.logger.debug(f"Using shared schedule for {season_year}")
+                return BaseNRLManager._shared_data
             cached_data = self.cache_manager.get(cache_key)
             if cached_data:
                 # Validate cached data structure
                 if isinstance(cached_data, dict) and "events" in cached_data:
                     self.logger.info(f"Using cached schedule for {season_year}")
+                    self._set_shared_data(cache_key, cached_data)
                     return cached_data
                 elif isinstance(cached_data, list):
                     # Handle old cache format (list of events)
                     self.logger.info(
                         f"Using cached schedule for {season_year} (legacy format)"
                     )
-                    return {"events": cached_data}
+                    data = {"events": cached_data}
+                    self._set_shared_data(cache_key, data)
+                    return data
                 else:
                     self.logger.warning(
                         f"Invalid cached data format for {season_year}: {type(cached_data)}"
@@ -152,6 +183,7 @@ class BaseNRLManager(RugbyLeague):
                 # Cache the data
                 self.cache_manager.set(cache_key, data)
                 self.logger.info(f"Synchronously fetched {season_year} season schedule")
+                self._set_shared_data(cache_key, data)
                 return data
 
             except Exception as e:
@@ -1268,6 +1268,9 @@ class SportsCore(ABC):
 
 
 class SportsUpcoming(SportsCore):
+    # Attribute holding the games being displayed
+    GAMES_ATTR = "games_list"
+
     def __init__(
         self,
         config: Dict[str, Any],
@@ -1795,6 +1798,8 @@ class SportsUpcoming(SportsCore):
 
 
 class SportsRecent(SportsCore):
+    # Attribute holding the games being displayed
+    GAMES_ATTR = "games_list"
 
     def __init__(
         self,
@@ -2366,6 +2371,8 @@ class SportsRecent(SportsCore):
 
 
 class SportsLive(SportsCore):
+    # Attribute holding the games being displayed
+    GAMES_ATTR = "live_games"
 
     def __init__(
         self,
@@ -0,0 +1,82 @@
+"""
+Unit tests for game ID tracking used by dynamic duration.
+
+Tests _get_all_game_ids_for_manager:
+- Real and fallback game IDs
+- Cache hits while the game list is unchanged
+- Invalidation when the game list is replaced or grows
+"""
+
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    from manager import RugbyLeagueScoreboardPlugin
+except ImportError:  # Plugin dependencies (LEDMatrix, pytz, requests) not installed
+    RugbyLeagueScoreboardPlugin = None
+
+
+@unittest.skipIf(RugbyLeagueScoreboardPlugin is None, "plugin dependencies not installed")
+class TestGameIdTracking(unittest.TestCase):
+    """Test cases for _get_all_game_ids_for_manager."""
+
+    def setUp(self):
+        """Set up a minimal plugin stand-in with only the state the method uses."""
+        self.plugin = SimpleNamespace(
+            _manager_game_ids_cache={},
+            _get_game_list_for_manager=RugbyLeagueScoreboardPlugin._get_game_list_for_manager,
+        )
+
+    def get_ids(self, manager):
+        return RugbyLeagueScoreboardPlugin._get_all_game_ids_for_manager(self.plugin, manager)
+
+    def test_real_and_fallback_ids(self):
+        """Games without an id use the same fallbacks as _record_dynamic_progress."""
+        manager = SimpleNamespace(games_list=[
+            {'id': 401},
+            {'id': '402'},
+            {'away_abbr': 'MEL', 'home_abbr': 'PEN'},
+            {'away_abbr': 'MEL'},
+        ])
+        self.assertEqual(
+            self.get_ids(manager),
+            frozenset({'401', '402', 'MEL@PEN-2', 'index-3'}),
+        )
+
+    def test_empty_or_missing_list(self):
+        """Managers without games yield an empty set."""
+        self.assertEqual(self.get_ids(SimpleNamespace(games_list=[])), frozenset())
+        self.assertEqual(self.get_ids(SimpleNamespace()), frozenset())
+        self.assertEqual(self.get_ids(None), frozenset())
+
+    def test_cache_hit_for_unchanged_list(self):
+        """The same list object returns the cached set."""
+        manager = SimpleNamespace(live_games=[{'id': '1'}, {'id': '2'}])
+        first = self.get_ids(manager)
+        self.assertIs(self.get_ids(manager), first)
+
+    def test_invalidated_when_list_replaced(self):
+        """A rebuilt list of the same length is not served from the cache."""
+        manager = SimpleNamespace(games_list=[{'id': '1'}, {'id': '2'}])
+        self.assertEqual(self.get_ids(manager), frozenset({'1', '2'}))
+        # Managers rebuild the list on every update; replacing it twice between
+        # queries lets CPython hand the cached list's old address back out
+        for new_ids in (('3', '4'), ('5', '6'), ('7', '8')):
+            manager.games_list = [{'id': 'x'}, {'id': 'y'}]
+            manager.games_list = [{'id': game_id} for game_id in new_ids]
+            self.assertEqual(self.get_ids(manager), frozenset(new_ids))
+
+    def test_invalidated_when_list_grows(self):
+        """Appending to the cached list rebuilds the set."""
+        manager = SimpleNamespace(games_list=[{'id': '1'}])
+        self.get_ids(manager)
+        manager.games_list.append({'id': '2'})
+        self.assertEqual(self.get_ids(manager), frozenset({'1', '2'}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,10 @@
 import logging
 import os
-from datetime import datetime, timedelta
+import time
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import pytz
 import requests
@@ -17,6 +19,18 @@ ESPN_WNBA_SCOREBOARD_URL = (
 )
 
 
+@lru_cache(maxsize=4)
+def _season_metadata(sport_key: str, utc_date: date) -> Tuple[int, str, str]:
+    """Return (season_year, ESPN dates range, cache key) for the given UTC day."""
+    season_year = utc_date.year
+    # WNBA season typically runs from May to September
+    if utc_date.month < 5:
+        season_year = utc_date.year - 1
+    datestring = f"{season_year}0501-{season_year}0930"
+    cache_key = f"{sport_key}_schedule_{season_year}"
+    return season_year, datestring, cache_key
+
+
 class BaseWNBAManager(RugbyLeague):
     """Base class for WNBA managers with common functionality."""
 
@@ -26,6 +40,8 @@ class BaseWNBAManager(RugbyLeague):
     _warning_cooldown = 60
     _shared_data = None
     _last_shared_update = 0
+    _shared_cache_key = None  # Season cache key _shared_data was loaded for
+    _shared_data_ttl = 60  # Seconds the shared schedule is reused across managers
 
     def __init__(self, config: Dict[str, Any], display_manager, cache_manager):
         self.logger = logging.getLogger("WNBA")
@@ -52,31 +68,49 @@ class BaseWNBAManager(RugbyLeague):
         )
         self.league = "wnba"
 
+    @staticmethod
+    def _set_shared_data(cache_key: str, data: Dict) -> None:
+        """Publish a season schedule to every manager of this league.
+
+        Set on BaseWNBAManager itself so Recent and Upcoming subclasses share it.
+        """
+        BaseWNBAManager._shared_data = data
+        BaseWNBAManager._shared_cache_key = cache_key
+        BaseWNBAManager._last_shared_update = time.monotonic()
+
     def _fetch_wnba_api_data(self, use_cache: bool = True) -> Optional[Dict]:
         """
         Fetches the full season schedule for WNBA using background threading.
         Returns cached data immediately if available, otherwise starts background fetch.
         """
-        now = datetime.now(pytz.utc)
-        season_year = now.year
-        # WNBA season typically runs from May to September
-        if now.month < 5:
-            season_year = now.year - 1
-        datestring = f"{season_year}0501-{season_year}0930"
-        cache_key = f"{self.sport_key}_schedule_{season_year}"
-
-        # Check cache first
+        # Season strings only change with the UTC day, so they are memoized
+        season_year, datestring, cache_key = _season_metadata(
+            self.sport_key, datetime.now(pytz.utc).date()
+        )
+
+        # Check cache first; Recent and Upcoming managers share one recent
+        # copy of the season schedule instead of each hitting the cache manager
         if use_cache:
+            if (
+                BaseWNBAManager._shared_cache_key == cache_key
+                and time.monotonic() - BaseWNBAManager._last_shared_update
+                < BaseWNBAManager._shared_data_ttl
+            ):
+                self.logger.debug(f"Using shared schedule for {season_year}")
+                return BaseWNBAManager._shared_data
             cached_data = self.cache_manager.get(cache_key)
             if cached_data:
                 if isinstance(cached_data, dict) and "events" in cached_data:
                     self.logger.info(f"Using cached schedule for {season_year}")
+                    self._set_shared_data(cache_key, cached_data)
                     return cached_data
                 elif isinstance(cached_data, list):
                     self.logger.info(
                         f"Using cached schedule for {season_year} (legacy format)"
                     )
-                    return {"events": cached_data}
+                    data = {"events": cached_data}
+                    self._set_shared_data(cache_key, data)
+                    return data
                 else:
                     self.logger.warning(
                         f"Invalid cached data format for {season_year}: {type(cached_data)}"
@@ -142,6 +176,7 @@ class BaseWNBAManager(RugbyLeague):
 
                 self.cache_manager.set(cache_key, data)
                 self.logger.info(f"Synchronously fetched {season_year} season schedule")
+                self._set_shared_data(cache_key, data)
                 return data
 
             except Exception as e: